@@ -0,0 +1,57 @@
+"""Benchmark expressions grouped by class.
+
+Keep the lists stable: baselines are compared class by class, so adding or
+removing an expression changes the numbers of its class.
+"""
+
+CORPUS = {
+    'polynomials': [
+        "x**2",
+        "x**3 - 3*x",
+        "x**4 - 5*x**2 + 4",
+        "3*x**5 - 20*x**3 + 7",
+        "(x - 1)**2 * (x + 2)**3",
+    ],
+    'rationals': [
+        "1 / (x**2 - 1)",
+        "(x**2 + 1) / (x - 2)",
+        "x / (x**2 + 1)",
+        "(x**3 - 2*x + 1) / (x**2 - 4)",
+        "(x**2 - 1) / (x - 1)",
+    ],
+    'trig': [
+        "sin(x)",
+        "cos(2*x) + sin(x)",
+        "tan(x)",
+        "sin(x)**2",
+        "x*sin(x)",
+    ],
+    'exp_log': [
+        "exp(x)",
+        "x*exp(-x)",
+        "log(x)/x",
+        "exp(-x**2)",
+        "x*log(x)",
+    ],
+    'radicals': [
+        "sqrt(x)",
+        "sqrt(x**2 - 4)",
+        "x*sqrt(1 - x**2)",
+        "1 / sqrt(x + 1)",
+        "cbrt(x)",
+    ],
+    'compositions': [
+        "exp(sin(x))",
+        "log(x**2 + 1)",
+        "sqrt(exp(x) + 1)",
+        "sin(1/(x**2 + 1))",
+        "atan(x) / x",
+    ],
+    'pathological': [
+        "(x**4 - 1) / (x**3 - 4*x)",
+        "sin(x)/x",
+        "exp(1/x)",
+        "x**x",
+        "abs(x)",
+    ],
+}
@@ -0,0 +1,226 @@
+"""Benchmark MathFunctionAnalysis over the expression corpus.
+
+Every expression is analyzed in a fresh process with a time limit. The run
+records per-stage latency, total latency, peak memory and the timeout rate for
+each class of the corpus and can save them as a JSON baseline or compare them
+with one:
+
+    python benchmarks/run.py --save benchmarks/baseline.json
+    python benchmarks/run.py --compare benchmarks/baseline.json --threshold 0.25
+
+With ``--compare`` the exit status is 1 if any class regressed by more than
+the threshold.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sympy as sp  # noqa: E402
+from sympy.core.cache import clear_cache  # noqa: E402
+
+from benchmarks.corpus import CORPUS  # noqa: E402
+from math_function_analysis import AnalysisStats, MathFunctionAnalysis, __version__  # noqa: E402
+
+BASELINE_VERSION = 1
+
+# Analyzed once per worker before measuring so that lazy imports and
+# one-time initialization are not charged to the first expression.
+WARMUP_EXPRESSION = "(x**2 + 1) / (x - 1) * exp(x)"
+
+
+def _measure(connection, function_str, mode, repeat, memory):
+    try:
+        MathFunctionAnalysis(WARMUP_EXPRESSION, mode=mode).compute()
+        timings = []
+        for _ in range(repeat):
+            # Without this, repeated runs would only measure SymPy's cache.
+            clear_cache()
+            analysis = MathFunctionAnalysis(function_str, mode=mode, profile=True)
+            start = time.perf_counter()
+            analysis.compute()
+            total = time.perf_counter() - start
+            stages = {stage: analysis.stats.stages[stage].wall_time for stage in analysis.STAGES}
+            timings.append((total, stages))
+        # Keep the fastest run: it is the least disturbed by the rest of the machine.
+        total, stages = min(timings, key=lambda timing: timing[0])
+        connection.send(('time', total, stages))
+        if memory:
+            clear_cache()
+            stats = AnalysisStats(memory=True)
+            analysis = MathFunctionAnalysis(function_str, mode=mode, profile=stats)
+            analysis.compute()
+            connection.send(('memory', max(stats.stages[stage].peak_memory for stage in analysis.STAGES)))
+    except Exception as e:
+        connection.send(('error', f"{type(e).__name__}: {e}"))
+    connection.send(('done',))
+
+
+def run_expression(function_str, mode='symbolic', timeout=30.0, repeat=1, memory=True, context=None):
+    """Benchmark one expression in a child process; return a result dict."""
+    context = context or multiprocessing.get_context()
+    connection, child_connection = context.Pipe(duplex=False)
+    # Not daemonic: in 'auto' mode the analysis starts child processes of its own.
+    process = context.Process(target=_measure, args=(child_connection, function_str, mode, repeat, memory))
+    process.start()
+    child_connection.close()
+    result = {'expression': function_str, 'status': 'ok', 'wall_time': None, 'stages': {},
+              'peak_memory': None, 'error': None}
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not connection.poll(remaining):
+                if result['wall_time'] is None:
+                    result['status'] = 'timeout'
+                break
+            try:
+                message = connection.recv()
+            except EOFError:
+                if result['wall_time'] is None:
+                    result['status'] = 'error'
+                    result['error'] = f"worker exited with code {process.exitcode}"
+                break
+            if message[0] == 'time':
+                result['wall_time'], result['stages'] = message[1], message[2]
+            elif message[0] == 'memory':
+                result['peak_memory'] = message[1]
+            elif message[0] == 'error':
+                result['status'], result['error'] = 'error', message[1]
+            else:
+                break
+    finally:
+        process.terminate()
+        process.join()
+        connection.close()
+    return result
+
+
+def summarize(results):
+    """Aggregate expression results into per-class metrics."""
+    classes = {}
+    for name in CORPUS:
+        group = [result for result in results if result['class'] == name]
+        if not group:
+            continue
+        finished = [result for result in group if result['status'] == 'ok']
+        memory = [result['peak_memory'] for result in finished if result['peak_memory'] is not None]
+        stage_names = sorted({stage for result in finished for stage in result['stages']})
+        classes[name] = {
+            'count': len(group),
+            'timeouts': sum(result['status'] == 'timeout' for result in group),
+            'errors': sum(result['status'] == 'error' for result in group),
+            'timeout_rate': sum(result['status'] == 'timeout' for result in group) / len(group),
+            'total_time': sum(result['wall_time'] for result in finished),
+            'median_time': statistics.median([result['wall_time'] for result in finished]) if finished else None,
+            'stages': {stage: sum(result['stages'].get(stage, 0.0) for result in finished)
+                       for stage in stage_names},
+            'peak_memory': max(memory) if memory else None,
+        }
+    return classes
+
+
+def run(classes=None, mode='symbolic', timeout=30.0, repeat=1, memory=True, verbose=False):
+    """Benchmark the corpus (or the named ``classes``) and return the report dict."""
+    results = []
+    for name, expressions in CORPUS.items():
+        if classes and name not in classes:
+            continue
+        for function_str in expressions:
+            result = run_expression(function_str, mode, timeout, repeat, memory)
+            result['class'] = name
+            results.append(result)
+            if verbose:
+                elapsed = result['wall_time']
+                print(f"{name:<14}{function_str:<32}{result['status']:<9}"
+                      f"{'' if elapsed is None else f'{elapsed:.3f}s'}", file=sys.stderr)
+    return {
+        'version': BASELINE_VERSION,
+        'environment': {'python': platform.python_version(), 'sympy': sp.__version__,
+                        'package': __version__, 'platform': platform.platform()},
+        'settings': {'mode': mode, 'timeout': timeout, 'repeat': repeat, 'memory': memory},
+        'classes': summarize(results),
+        'expressions': results,
+    }
+
+
+def compare(baseline, current, threshold=0.25, min_delta=0.05):
+    """Return a list of regressions of ``current`` against ``baseline``.
+
+    A class regresses if its total latency or peak memory grows by more than
+    ``threshold`` (a fraction), or if it has more timeouts or errors than
+    before. Latency changes below ``min_delta`` seconds are treated as noise.
+    """
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {baseline.get('version')}")
+    if baseline['settings'].get('mode') != current['settings'].get('mode'):
+        raise ValueError("The baseline was recorded in a different solver mode")
+    regressions = []
+    for name, before in baseline['classes'].items():
+        after = current['classes'].get(name)
+        if after is None:
+            continue
+        if after['timeout_rate'] > before['timeout_rate']:
+            regressions.append(f"{name}: timeout rate {before['timeout_rate']:.0%} -> {after['timeout_rate']:.0%}")
+        if after['errors'] > before['errors']:
+            regressions.append(f"{name}: errors {before['errors']} -> {after['errors']}")
+        old, new = before['total_time'], after['total_time']
+        if new - old > max(old * threshold, min_delta):
+            regressions.append(f"{name}: total time {old:.3f}s -> {new:.3f}s (+{(new - old) / max(old, 1e-9):.0%})")
+        old, new = before['peak_memory'], after['peak_memory']
+        if old and new and new - old > old * threshold:
+            regressions.append(f"{name}: peak memory {old} B -> {new} B (+{(new - old) / old:.0%})")
+    return regressions
+
+
+def format_report(report):
+    lines = [f"{'class':<14}{'n':>4}{'timeouts':>10}{'errors':>8}{'total, s':>11}{'median, s':>11}{'peak memory, B':>16}"]
+    for name, metrics in report['classes'].items():
+        median = '' if metrics['median_time'] is None else f"{metrics['median_time']:.3f}"
+        memory = '' if metrics['peak_memory'] is None else metrics['peak_memory']
+        lines.append(f"{name:<14}{metrics['count']:>4}{metrics['timeouts']:>10}{metrics['errors']:>8}"
+                     f"{metrics['total_time']:>11.3f}{median:>11}{memory:>16}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--save', metavar='PATH', help="write the results to a JSON baseline file")
+    parser.add_argument('--compare', metavar='PATH', help="compare with a baseline file and fail on regressions")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed relative slowdown or memory growth per class (default: 0.25)")
+    parser.add_argument('--min-delta', type=float, default=0.05,
+                        help="latency changes below this many seconds are ignored (default: 0.05)")
+    parser.add_argument('--mode', choices=MathFunctionAnalysis.MODES, default='symbolic', help="solver mode")
+    parser.add_argument('--timeout', type=float, default=30.0, help="time limit per expression in seconds")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per expression; the fastest is kept")
+    parser.add_argument('--no-memory', action='store_true', help="skip the peak memory measurement")
+    parser.add_argument('--classes', nargs='+', choices=list(CORPUS), help="benchmark only these classes")
+    parser.add_argument('-v', '--verbose', action='store_true', help="print every expression as it finishes")
+    args = parser.parse_args(argv)
+
+    report = run(args.classes, args.mode, args.timeout, args.repeat, not args.no_memory, args.verbose)
+    print(format_report(report))
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, report, args.threshold, args.min_delta)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regressions.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
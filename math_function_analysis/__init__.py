@@ -1 +1,19 @@
-from .analysis import MathFunctionAnalysis
\ No newline at end of file
+__version__ = '0.1.0'
+
+from .analysis import MathFunctionAnalysis
+from .cache import AnalysisCache
+from .batch import BatchResult, analyze_many
+from .parametric import ParametricAnalysis
+from .profiling import AnalysisStats
+from .results import AnalysisResult
+
+
+_SERVICE_NAMES = ('AnalysisService', 'ServiceBusy', 'analyze_async')
+
+
+def __getattr__(name):
+    # The asyncio front end is imported on first use to keep the package import light.
+    if name in _SERVICE_NAMES:
+        from . import service
+        return getattr(service, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,191 @@
 import sympy as sp
-import matplotlib.pyplot as plt
-from IPython.display import display, Latex
 import numpy as np
 
+from . import rational
+from .numeric import compile_function, find_roots
+from .profiling import AnalysisStats
+from .results import AnalysisResult
+from .translations import translate
+from .utils import run_with_timeout
+
 class MathFunctionAnalysis:
-    def __init__(self, function_str, language='ru'):
+    MODES = ('symbolic', 'numeric', 'auto')
+
+    STAGES = ('domain', 'intercepts', 'asymptotes', 'first_derivative_analysis', 'second_derivative_analysis')
+
+    _STAGE_METHODS = {
+        'domain': '_find_domain',
+        'intercepts': '_find_intercepts',
+        'asymptotes': '_find_asymptotes',
+        'first_derivative_analysis': '_analyze_first_derivative',
+        'second_derivative_analysis': '_analyze_second_derivative',
+    }
+
+    _STAGE_DEPENDENCIES = {
+        'first_derivative_analysis': ('domain',),
+        'second_derivative_analysis': ('domain',),
+    }
+
+    def __init__(self, function_str, language='ru', cache=None, mode='symbolic', solve_timeout=5.0,
+                 search_window=(-10, 10), profile=False):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode: {mode}")
         self.x = sp.symbols('x')
         self.function = sp.sympify(function_str)
         self.language = language
-        self.domain = self._find_domain()
-        self.intercepts = self._find_intercepts()
-        self.asymptotes = self._find_asymptotes()
-        self.first_derivative_analysis = self._analyze_first_derivative()
-        self.second_derivative_analysis = self._analyze_second_derivative()
+        self.cache = cache
+        self.mode = mode
+        self.solve_timeout = solve_timeout
+        self.search_window = tuple(search_window)
+        if profile is True:
+            profile = AnalysisStats()
+        self.stats = profile or None
+        self._cache_key = None
+        self._results = {}
+        self._intermediates = {}
+
+    @property
+    def domain(self):
+        return self._stage('domain')
+
+    @property
+    def intercepts(self):
+        return self._stage('intercepts')
+
+    @property
+    def asymptotes(self):
+        return self._stage('asymptotes')
+
+    @property
+    def first_derivative_analysis(self):
+        return self._stage('first_derivative_analysis')
+
+    @property
+    def second_derivative_analysis(self):
+        return self._stage('second_derivative_analysis')
+
+    def compute(self, stages=None):
+        """Compute the given stages (all by default) and return their results by name."""
+        if stages is None:
+            stages = self.STAGES
+        elif isinstance(stages, str):
+            stages = (stages,)
+        return {stage: self._stage(stage) for stage in stages}
+
+    def _stage(self, name):
+        if name not in self._results:
+            if name not in self._STAGE_METHODS:
+                raise ValueError(f"Unknown analysis stage: {name}")
+            result = self._cached_stage(name)
+            if result is None:
+                for dependency in self._STAGE_DEPENDENCIES.get(name, ()):
+                    self._stage(dependency)
+                result = self._measured(name, getattr(self, self._STAGE_METHODS[name]))
+                if self.cache is not None:
+                    self.cache.set(self._cache_key, name, result)
+            self._results[name] = result
+        return self._results[name]
+
+    def _cached_stage(self, name):
+        if self.cache is None:
+            return None
+        if self._cache_key is None:
+            variant = self.mode
+            if self.mode != 'symbolic':
+                variant += f":{self.search_window}"
+            if self.mode == 'auto':
+                # Whether a solve fell back to numeric depends on the time budget.
+                variant += f":{self.solve_timeout}"
+            self._cache_key = self.cache.key(self.function, variant)
+        return self.cache.get(self._cache_key, name)
+
+    def _intermediate(self, name, *args):
+        """Return a named intermediate result, computing it once per instance.
+
+        Intermediates form a dependency graph: ``('roots', 'simplified_derivative', 1)``
+        solves the memoized ``('simplified_derivative', 1)``, which in turn
+        simplifies the memoized ``('derivative', 1)``.
+        """
+        key = (name,) + args
+        if key not in self._intermediates:
+            self._intermediates[key] = self._measured(name, getattr(self, '_compute_' + name), *args)
+        return self._intermediates[key]
+
+    def _measured(self, name, func, *args):
+        """Call ``func``, recording its cost under ``name`` in ``self.stats`` when profiling."""
+        if self.stats is None:
+            return func(*args)
+        with self.stats.measure(name):
+            return func(*args)
+
+    def _compute_function(self):
+        return self.function
+
+    def _compute_numerator(self):
+        return sp.numer(self.function)
+
+    def _compute_denominator(self):
+        return sp.denom(self.function)
+
+    def _compute_derivative(self, order):
+        return sp.diff(self.function, self.x, order)
+
+    def _compute_simplified_derivative(self, order):
+        return sp.simplify(self._intermediate('derivative', order))
+
+    def _compute_rational(self, *source):
+        if self.mode == 'numeric':
+            return None
+        return rational.as_rational(self._intermediate(*source), self.x)
+
+    def _compute_roots(self, *source):
+        rational_form = self._intermediate('rational', *source)
+        if rational_form is not None:
+            return rational.roots(*rational_form)
+        # Zeros of the denominator lie outside the domain by definition.
+        return self._solve(self._intermediate(*source), within_domain=source != ('denominator',))
+
+    def _solve(self, expression, within_domain=True):
+        """Solve ``expression = 0`` for x according to ``self.mode``.
+
+        In ``'auto'`` mode ``sp.solve`` runs in a reusable solver process that
+        is killed after ``solve_timeout`` seconds; if it runs out of time, fails, or
+        cannot produce an explicit list of solutions, the numeric root finder
+        is used instead. The numeric root finder only searches
+        ``search_window``.
+        """
+        if self.mode == 'symbolic':
+            return sp.solve(expression, self.x)
+        if self.mode == 'auto':
+            try:
+                solutions = run_with_timeout(sp.solve, self.solve_timeout, expression, self.x)
+            except Exception:
+                pass
+            else:
+                if isinstance(solutions, list):
+                    return solutions
+        return find_roots(expression, self.x, self.domain if within_domain else None, window=self.search_window)
+
+    def _compute_sorted_real_roots(self, *source):
+        rational_form = self._intermediate('rational', *source)
+        if rational_form is not None:
+            return rational.sorted_real_roots(*rational_form)
+        return sorted([root.evalf() for root in self._intermediate('roots', *source) if root.is_real])
+
+    def _compute_evaluator(self, order):
+        expression = self.function if order == 0 else self._intermediate('simplified_derivative', order)
+        return compile_function(expression, self.x, self.domain)
+
+    def _compute_result(self, *stages):
+        return AnalysisResult.from_analysis(self, stages)
+
+    def _compute_domain_intervals(self, *source):
+        return self._get_domain_intervals(self._intermediate('sorted_real_roots', *source))
 
     def _find_domain(self):
+        rational_form = self._intermediate('rational', 'function')
+        if rational_form is not None:
+            return rational.domain(rational_form[1])
         try:
             domain = sp.calculus.util.continuous_domain(self.function, self.x, sp.S.Reals)
         except Exception as e:
@@ -22,14 +193,14 @@ class MathFunctionAnalysis:
         return domain
 
     def _find_intercepts(self):
-        x_intercepts = sp.solve(self.function, self.x)
+        x_intercepts = self._intermediate('roots', 'function')
         y_intercept = self.function.subs(self.x, 0)
         return {'x': x_intercepts, 'y': y_intercept}
 
     def _find_asymptotes(self):
-        vertical_asymptotes = self._find_vertical_asymptotes()
-        horizontal_asymptotes = self._find_horizontal_asymptotes()
-        oblique_asymptotes = self._find_oblique_asymptotes()
+        vertical_asymptotes = self._measured('vertical_asymptotes', self._find_vertical_asymptotes)
+        horizontal_asymptotes = self._measured('horizontal_asymptotes', self._find_horizontal_asymptotes)
+        oblique_asymptotes = self._measured('oblique_asymptotes', self._find_oblique_asymptotes)
         return {
             'vertical': vertical_asymptotes,
             'horizontal': horizontal_asymptotes,
@@ -38,13 +209,15 @@ class MathFunctionAnalysis:
 
     def _find_vertical_asymptotes(self):
         try:
-            denom = sp.denom(self.function)
-            vertical_asymptotes = sp.solve(denom, self.x)
+            vertical_asymptotes = self._intermediate('roots', 'denominator')
         except Exception as e:
             vertical_asymptotes = f"Error finding vertical asymptotes: {e}"
         return vertical_asymptotes
 
     def _find_horizontal_asymptotes(self):
+        rational_form = self._intermediate('rational', 'function')
+        if rational_form is not None:
+            return rational.limits_at_infinity(*rational_form)
         try:
             limit_pos_inf = sp.limit(self.function, self.x, sp.oo)
             limit_neg_inf = sp.limit(self.function, self.x, -sp.oo)
@@ -54,22 +227,25 @@ class MathFunctionAnalysis:
         return (limit_pos_inf, limit_neg_inf)
 
     def _find_oblique_asymptotes(self):
+        rational_form = self._intermediate('rational', 'function')
+        if rational_form is not None:
+            return rational.oblique_asymptote(*rational_form)
         try:
-            degree_num = sp.degree(sp.numer(self.function))
-            degree_den = sp.degree(sp.denom(self.function))
-            if degree_num > degree_den:
-                quotient, remainder = sp.div(sp.numer(self.function), sp.denom(self.function))
+            numerator = self._intermediate('numerator')
+            denominator = self._intermediate('denominator')
+            if sp.degree(numerator) > sp.degree(denominator):
+                quotient, remainder = sp.div(numerator, denominator)
                 return quotient
         except Exception as e:
             return f"Error finding oblique asymptote: {e}"
         return None
 
     def _analyze_first_derivative(self):
-        first_derivative = sp.diff(self.function, self.x)
-        simplified_first_derivative = sp.simplify(first_derivative)
-        critical_points = sp.solve(simplified_first_derivative, self.x)
-        increasing_intervals = self._find_monotone_intervals(simplified_first_derivative, self.x)
-        decreasing_intervals = self._find_monotone_intervals(-simplified_first_derivative, self.x)
+        simplified_first_derivative = self._intermediate('simplified_derivative', 1)
+        critical_points = self._intermediate('roots', 'simplified_derivative', 1)
+        domain_intervals = self._intermediate('domain_intervals', 'simplified_derivative', 1)
+        increasing_intervals = self._measured('interval_classification', self._find_monotone_intervals, 1, domain_intervals, 1)
+        decreasing_intervals = self._measured('interval_classification', self._find_monotone_intervals, 1, domain_intervals, -1)
         extrema_values = {point: self.function.subs(self.x, point) for point in critical_points}
         return {
             'derivative': simplified_first_derivative,
@@ -80,11 +256,11 @@ class MathFunctionAnalysis:
         }
 
     def _analyze_second_derivative(self):
-        second_derivative = sp.diff(self.function, self.x, 2)
-        simplified_second_derivative = sp.simplify(second_derivative)
-        inflection_points = sp.solve(simplified_second_derivative, self.x)
-        concave_up_intervals = self._find_monotone_intervals(simplified_second_derivative, self.x)
-        concave_down_intervals = self._find_monotone_intervals(-simplified_second_derivative, self.x)
+        simplified_second_derivative = self._intermediate('simplified_derivative', 2)
+        inflection_points = self._intermediate('roots', 'simplified_derivative', 2)
+        domain_intervals = self._intermediate('domain_intervals', 'simplified_derivative', 2)
+        concave_up_intervals = self._measured('interval_classification', self._find_monotone_intervals, 2, domain_intervals, 1)
+        concave_down_intervals = self._measured('interval_classification', self._find_monotone_intervals, 2, domain_intervals, -1)
         inflection_values = {point: self.function.subs(self.x, point) for point in inflection_points}
         return {
             'derivative': simplified_second_derivative,
@@ -94,15 +270,20 @@ class MathFunctionAnalysis:
             'inflection_values': inflection_values
         }
 
-    def _find_monotone_intervals(self, derivative, variable):
-        critical_points = sp.solve(derivative, variable)
-        critical_points = sorted([cp.evalf() for cp in critical_points if cp.is_real])
-        domain_intervals = self._get_domain_intervals(critical_points)
+    def _find_monotone_intervals(self, order, domain_intervals, direction):
+        """Intervals on which ``direction`` times the derivative of ``order`` is positive."""
+        derivative = direction * self._intermediate('simplified_derivative', order)
+        rational_form = self._intermediate('rational', 'simplified_derivative', order)
         monotone_intervals = []
         for interval in domain_intervals:
             test_point = (interval.start + interval.end) / 2
             if test_point.is_real:
-                test_value = derivative.subs(variable, test_point)
+                if rational_form is not None:
+                    test_sign = rational.sign(*rational_form, test_point)
+                    if test_sign is not None and direction * test_sign > 0:
+                        monotone_intervals.append(interval)
+                    continue
+                test_value = derivative.subs(self.x, test_point)
                 if test_value.is_real and test_value > 0:
                     monotone_intervals.append(interval)
         return monotone_intervals
@@ -127,41 +308,63 @@ class MathFunctionAnalysis:
         intervals.append(sp.Interval(start, domain.end, left_open=start == domain.start, right_open=domain.end == sp.oo))
         return intervals
 
-    def plot(self):
-        f = sp.lambdify(self.x, self.function, 'numpy')
-        x_vals = np.linspace(-10, 10, 400)
-        y_vals = np.array([f(val) if val not in self.asymptotes['vertical'] else np.nan for val in x_vals])
+    def evaluator(self, order=0):
+        """Return a cached vectorized evaluator of the function (``order=0``) or of its derivative.
+
+        The evaluator accepts scalars or NumPy arrays and returns NaN outside the domain.
+        """
+        return self._intermediate('evaluator', order)
+
+    def tabulate(self, x_start, x_stop, n, chunk=1_000_000, out=None, orders=(0, 1, 2)):
+        """Tabulate the function and its derivatives on ``n`` evenly spaced points.
+
+        Returns an array of shape ``(n, 1 + len(orders))`` whose first column
+        holds x and the others the values for each order in ``orders``. The
+        table is filled ``chunk`` rows at a time; if ``out`` is a path, it is
+        written to a ``np.memmap`` at that path so memory use stays flat.
+        """
+        evaluators = [self.evaluator(order) for order in orders]
+        shape = (n, 1 + len(orders))
+        if out is None:
+            table = np.empty(shape)
+        else:
+            table = np.memmap(out, dtype=np.float64, mode='w+', shape=shape)
+        step = (x_stop - x_start) / (n - 1) if n > 1 else 0.0
+        for start in range(0, n, chunk):
+            stop = min(start + chunk, n)
+            xs = x_start + step * np.arange(start, stop, dtype=np.float64)
+            if stop == n and n > 1:
+                xs[-1] = x_stop
+            table[start:stop, 0] = xs
+            for column, evaluate in enumerate(evaluators, 1):
+                table[start:stop, column] = evaluate(xs)
+        if out is not None:
+            table.flush()
+        return table
 
+    def plot(self, x_range=None, points=400):
+        self._measured('plot', self._plot, x_range, points)
+
+    def _plot(self, x_range, points):
+        import matplotlib.pyplot as plt
+        from . import plotting
         plt.figure(figsize=(10, 6))
-        plt.plot(x_vals, y_vals, label=self._translate('Function'))
-
-        if self.intercepts['y']:
-            plt.scatter([0], [self.intercepts['y']], color='red', label=self._translate('Y-intercept'))
-        for intercept in self.intercepts['x']:
-            plt.scatter([intercept], [0], color='green', label=self._translate('X-intercept') if self.intercepts['y'] == 0 else '')
-
-        for va in self.asymptotes['vertical']:
-            plt.axvline(va, color='purple', linestyle='--', label=f"{self._translate('Vertical Asymptote at x=')} {va}")
-
-        if self.asymptotes['horizontal'][0] != sp.oo and self.asymptotes['horizontal'][0] != -sp.oo:
-            plt.axhline(self.asymptotes['horizontal'][0], color='orange', linestyle='--', label=f"{self._translate('Horizontal Asymptote at y=')} {self.asymptotes['horizontal'][0]}")
-        if self.asymptotes['horizontal'][1] != sp.oo and self.asymptotes['horizontal'][1] != -sp.oo:
-            plt.axhline(self.asymptotes['horizontal'][1], color='orange', linestyle='--', label=f"{self._translate('Horizontal Asymptote at y=')} {self.asymptotes['horizontal'][1]}")
-
-        if self.asymptotes['oblique']:
-            oblique_func = sp.lambdify(self.x, self.asymptotes['oblique'], 'numpy')
-            y_oblique = np.array([oblique_func(val) for val in x_vals])
-            plt.plot(x_vals, y_oblique, color='brown', linestyle='--', label=self._translate('Oblique Asymptote'))
-
-        plt.axhline(0, color='black', linewidth=0.8)
-        plt.axvline(0, color='black', linewidth=0.8)
-        plt.grid(color='gray', linestyle='--', linewidth=0.5)
-        plt.title(self._translate('Function Analysis Plot'))
-        plt.xlabel(self._translate('x'))
-        plt.ylabel(self._translate('y'))
-        plt.legend()
+        plotting.draw(plt.gca(), self, x_range, points)
         plt.show()
 
+    def render_plot(self, path=None, format='png', x_range=None, points=400):
+        """Render the plot headlessly to ``path``, or return the image bytes if no path is given."""
+        from . import plotting
+        return self._measured('plot', plotting.render, self, path, format, x_range, points)
+
+    def serialize(self, stages=None):
+        """Return the results of ``stages`` (all by default) as a cached :class:`AnalysisResult`."""
+        if stages is None:
+            stages = self.STAGES
+        elif isinstance(stages, str):
+            stages = (stages,)
+        return self._intermediate('result', *stages)
+
     def report(self):
         report = (
             f"{self._translate('Domain')}: {self.domain}\n"
@@ -173,112 +376,12 @@ class MathFunctionAnalysis:
         return report
 
     def display_report(self):
-        display(Latex("\\textbf{{{}}}:".format(self._translate('Domain')) + " {}".format(sp.latex(self.domain))))
-        display(Latex("\\textbf{{{}}}:".format(self._translate('Intercepts')) +
-                      " X: {}, Y: {}".format(', '.join(map(lambda x: sp.latex(x), self.intercepts['x'])),
-                                             sp.latex(self.intercepts['y']))))
-        display(Latex("\\textbf{{{}}}:".format(self._translate('Asymptotes')) +
-                      " {}: {}, {}: {}, {}: {}".format(
-                          self._translate('Vertical'),
-                          ', '.join(map(lambda x: sp.latex(x), self.asymptotes['vertical'])),
-                          self._translate('Horizontal'),
-                          ', '.join(map(lambda x: sp.latex(x), self.asymptotes['horizontal'])),
-                          self._translate('Oblique'), sp.latex(self.asymptotes['oblique']))))
-        display(Latex("\\textbf{{{}}}:".format(self._translate('First Derivative Analysis')) +
-                      " {}: {}, {}: {}, {}: {}, {}: {}".format(
-                          self._translate('Derivative'), sp.latex(self.first_derivative_analysis['derivative']),
-                          self._translate('Critical Points'),
-                          ', '.join(map(lambda x: sp.latex(x), self.first_derivative_analysis['critical_points'])),
-                          self._translate('Increasing Intervals'),
-                          ', '.join(map(lambda x: sp.latex(x), self.first_derivative_analysis['increasing_intervals'])),
-                          self._translate('Decreasing Intervals'),
-                          ', '.join(map(lambda x: sp.latex(x), self.first_derivative_analysis['decreasing_intervals'])),
-                          self._translate('Extrema Values'),
-                          ', '.join(map(lambda x: "${}$: ${}$".format(sp.latex(x),
-                                                                     sp.latex(self.first_derivative_analysis['extrema_values'][x])),
-                                       self.first_derivative_analysis['extrema_values'])))))
-        display(Latex("\\textbf{{{}}}:".format(self._translate('Second Derivative Analysis')) +
-                      " {}: {}, {}: {}, {}: {}, {}: {}".format(
-                          self._translate('Derivative'), sp.latex(self.second_derivative_analysis['derivative']),
-                          self._translate('Inflection Points'),
-                          ', '.join(map(lambda x: sp.latex(x), self.second_derivative_analysis['inflection_points'])),
-                          self._translate('Concave Up Intervals'),
-                          ', '.join(map(lambda x: sp.latex(x), self.second_derivative_analysis['concave_up_intervals'])),
-                          self._translate('Concave Down Intervals'),
-                          ', '.join(map(lambda x: sp.latex(x), self.second_derivative_analysis['concave_down_intervals'])),
-                          self._translate('Inflection Values'),
-                          ', '.join(map(lambda x: "${}$: ${}$".format(sp.latex(x),
-                                                                     sp.latex(self.second_derivative_analysis['inflection_values'][x])),
-                                       self.second_derivative_analysis['inflection_values'])))))
+        from . import notebook
+        self._measured('rendering', notebook.display_report, self)
 
     def step_by_step_analysis(self):
-        steps = [
-            "\\textbf{{{0}}}: {1}".format(self._translate('Domain'), sp.latex(self.domain)),
-            "\\textbf{{{0}}}: X: {1}, Y: {2}".format(self._translate('Intercepts'),
-                                                     ', '.join(map(lambda x: sp.latex(x), self.intercepts['x'])),
-                                                     sp.latex(self.intercepts['y'])),
-            "\\textbf{{{0}}}: {1}: {2}, {3}: {4}, {5}: {6}".format(self._translate('Asymptotes'),
-                                                                   self._translate('Vertical'),
-                                                                   ', '.join(map(lambda x: sp.latex(x), self.asymptotes['vertical'])),
-                                                                   self._translate('Horizontal'),
-                                                                   ', '.join(map(lambda x: sp.latex(x), self.asymptotes['horizontal'])),
-                                                                   self._translate('Oblique'),
-                                                                   sp.latex(self.asymptotes['oblique'])),
-            "\\textbf{{{0}}}:".format(self._translate('First Derivative Analysis')),
-            "\\quad {0}: {1}".format(self._translate('Derivative'), sp.latex(self.first_derivative_analysis['derivative'])),
-            "\\quad {0}: {1}".format(self._translate('Critical Points'),
-                                     ', '.join(map(lambda x: sp.latex(x), self.first_derivative_analysis['critical_points']))),
-            "\\quad {0}: {1}".format(self._translate('Increasing Intervals'),
-                                     ', '.join(map(lambda x: sp.latex(x), self.first_derivative_analysis['increasing_intervals']))),
-            "\\quad {0}: {1}".format(self._translate('Decreasing Intervals'),
-                                     ', '.join(map(lambda x: sp.latex(x), self.first_derivative_analysis['decreasing_intervals']))),
-            "\\quad {0}: {1}".format(self._translate('Extrema Values'),
-                                     ', '.join(map(lambda x: "${}$: ${}$".format(sp.latex(x),
-                                                                                sp.latex(self.first_derivative_analysis['extrema_values'][x])),
-                                                   self.first_derivative_analysis['extrema_values']))),
-            "\\textbf{{{0}}}:".format(self._translate('Second Derivative Analysis')),
-            "\\quad {0}: {1}".format(self._translate('Derivative'), sp.latex(self.second_derivative_analysis['derivative'])),
-            "\\quad {0}: {1}".format(self._translate('Inflection Points'),
-                                     ', '.join(map(lambda x: sp.latex(x), self.second_derivative_analysis['inflection_points']))),
-            "\\quad {0}: {1}".format(self._translate('Concave Up Intervals'),
-                                     ', '.join(map(lambda x: sp.latex(x), self.second_derivative_analysis['concave_up_intervals']))),
-            "\\quad {0}: {1}".format(self._translate('Concave Down Intervals'),
-                                     ', '.join(map(lambda x: sp.latex(x), self.second_derivative_analysis['concave_down_intervals']))),
-            "\\quad {0}: {1}".format(self._translate('Inflection Values'),
-                                     ', '.join(map(lambda x: "${}$: ${}$".format(sp.latex(x),
-                                                                                sp.latex(self.second_derivative_analysis['inflection_values'][x])),
-                                                   self.second_derivative_analysis['inflection_values'])))
-        ]
-        for step in steps:
-            display(Latex(step))
+        from . import notebook
+        self._measured('rendering', notebook.step_by_step_analysis, self)
 
     def _translate(self, key):
-        translations = {
-            'Domain': {'ru': 'Область определения', 'en': 'Domain'},
-            'Intercepts': {'ru': 'Пересечения с осями', 'en': 'Intercepts'},
-            'Asymptotes': {'ru': 'Асимптоты', 'en': 'Asymptotes'},
-            'Vertical': {'ru': 'Вертикальные', 'en': 'Vertical'},
-            'Horizontal': {'ru': 'Горизонтальные', 'en': 'Horizontal'},
-            'Oblique': {'ru': 'Наклонные', 'en': 'Oblique'},
-            'Function': {'ru': 'Функция', 'en': 'Function'},
-            'Y-intercept': {'ru': 'Пересечение с осью Y', 'en': 'Y-intercept'},
-            'X-intercept': {'ru': 'Пересечение с осью X', 'en': 'X-intercept'},
-            'Vertical Asymptote at x=': {'ru': 'Вертикальная асимптота в x=', 'en': 'Vertical Asymptote at x='},
-            'Horizontal Asymptote at y=': {'ru': 'Горизонтальная асимптота в y=', 'en': 'Horizontal Asymptote at y='},
-            'Oblique Asymptote': {'ru': 'Наклонная асимптота', 'en': 'Oblique Asymptote'},
-            'Function Analysis Plot': {'ru': 'График функции', 'en': 'Function Analysis Plot'},
-            'x': {'ru': 'x', 'en': 'x'},
-            'y': {'ru': 'y', 'en': 'y'},
-            'First Derivative Analysis': {'ru': 'Анализ первой производной', 'en': 'First Derivative Analysis'},
-            'Derivative': {'ru': 'Производная', 'en': 'Derivative'},
-            'Critical Points': {'ru': 'Критические точки', 'en': 'Critical Points'},
-            'Increasing Intervals': {'ru': 'Промежутки возрастания', 'en': 'Increasing Intervals'},
-            'Decreasing Intervals': {'ru': 'Промежутки убывания', 'en': 'Decreasing Intervals'},
-            'Extrema Values': {'ru': 'Значения экстремумов', 'en': 'Extrema Values'},
-            'Second Derivative Analysis': {'ru': 'Анализ второй производной', 'en': 'Second Derivative Analysis'},
-            'Inflection Points': {'ru': 'Точки перегиба', 'en': 'Inflection Points'},
-            'Concave Up Intervals': {'ru': 'Промежутки выпуклости вверх', 'en': 'Concave Up Intervals'},
-            'Concave Down Intervals': {'ru': 'Промежутки выпуклости вниз', 'en': 'Concave Down Intervals'},
-            'Inflection Values': {'ru': 'Значения в точках перегиба', 'en': 'Inflection Values'}
-        }
-        return translations.get(key, {}).get(self.language, key)
\ No newline at end of file
+        return translate(key, self.language)
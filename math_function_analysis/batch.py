@@ -0,0 +1,207 @@
+import multiprocessing
+import multiprocessing.util
+import os
+import time
+from collections import namedtuple
+from multiprocessing.connection import wait
+
+from .analysis import MathFunctionAnalysis
+
+BatchResult = namedtuple('BatchResult', ['index', 'function_str', 'status', 'results', 'error', 'timed_out_stage', 'elapsed'])
+BatchResult.__doc__ = """Outcome of analyzing one expression with :func:`analyze_many`.
+
+``status`` is ``'ok'``, ``'error'`` or ``'timeout'``. ``results`` maps every
+stage that finished to its result, so it is partial unless the status is
+``'ok'``. ``timed_out_stage`` names the stage that exceeded its budget.
+"""
+
+
+def _worker(connection, options):
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        index, function_str, stages = task
+        # The budgets start now, not when the task was sent to a worker that may still be booting.
+        connection.send(('start', index))
+        try:
+            analysis = MathFunctionAnalysis(function_str, **options)
+            for stage in stages:
+                connection.send(('stage', index, stage, analysis._stage(stage)))
+        except Exception as e:
+            connection.send(('error', index, f"{type(e).__name__}: {e}"))
+        else:
+            connection.send(('done', index))
+
+
+class _WorkerSlot:
+    def __init__(self, context, options):
+        self.connection, child_connection = context.Pipe()
+        # Not daemonic: in 'auto' mode the analysis starts a solver process of its own.
+        self.process = context.Process(target=_worker, args=(child_connection, options))
+        self.process.start()
+        child_connection.close()
+        # Stop the worker at interpreter exit even if the caller abandons the generator.
+        self._finalizer = multiprocessing.util.Finalize(
+            self, _stop_worker, args=(self.connection, self.process), exitpriority=10
+        )
+        self.task = None
+        self.broken = False
+
+    def assign(self, index, function_str, stages):
+        self.task = {
+            'index': index,
+            'function_str': function_str,
+            'stages': stages,
+            'results': {},
+            'started': None,
+            'stage_started': None,
+        }
+        self.connection.send((index, function_str, stages))
+
+    def pending_stage(self):
+        for stage in self.task['stages']:
+            if stage not in self.task['results']:
+                return stage
+        return None
+
+    def finish(self, status, error=None, timed_out_stage=None):
+        task = self.task
+        self.task = None
+        now = time.monotonic()
+        elapsed = now - task['started'] if task['started'] is not None else 0.0
+        return BatchResult(task['index'], task['function_str'], status, task['results'], error,
+                           timed_out_stage, elapsed)
+
+    def kill(self):
+        self.process.terminate()
+        self._finalizer()
+
+    def shutdown(self):
+        self._finalizer()
+
+
+def _stop_worker(connection, process):
+    try:
+        connection.send(None)
+    except (OSError, ValueError):
+        pass
+    process.join(1)
+    if process.is_alive():
+        process.terminate()
+        process.join(1)
+    if process.is_alive():
+        process.kill()
+        process.join()
+    connection.close()
+
+
+def analyze_many(function_strs, workers=None, timeout=None, stage_timeout=None, stages=None,
+                 language='ru', cache=None, context=None, mode='symbolic', solve_timeout=5.0,
+                 search_window=(-10, 10)):
+    """Analyze many expressions on a pool of worker processes.
+
+    Yields a :class:`BatchResult` per expression in completion order. An
+    expression that runs longer than ``timeout`` seconds overall, or longer
+    than ``stage_timeout`` seconds on a single stage, is abandoned: its worker
+    is killed and replaced, and the result carries the stages finished so far.
+    Both budgets start when a worker picks the expression up, so the time a
+    new worker spends starting is not charged to it. ``mode``,
+    ``solve_timeout`` and ``search_window`` are passed on to
+    :class:`MathFunctionAnalysis`.
+    """
+    stages = tuple(MathFunctionAnalysis.STAGES if stages is None else stages)
+    if mode not in MathFunctionAnalysis.MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+    options = {'language': language, 'cache': cache, 'mode': mode, 'solve_timeout': solve_timeout,
+               'search_window': tuple(search_window)}
+    context = context or multiprocessing.get_context()
+    tasks = iter(enumerate(function_strs))
+    slots = [None] * (workers or os.cpu_count() or 1)
+    exhausted = False
+    try:
+        while True:
+            for i, slot in enumerate(slots):
+                if exhausted:
+                    break
+                if slot is None or slot.task is None:
+                    try:
+                        index, function_str = next(tasks)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if slot is None:
+                        slot = slots[i] = _WorkerSlot(context, options)
+                    slot.assign(index, function_str, stages)
+
+            busy = [i for i, slot in enumerate(slots) if slot is not None and slot.task is not None]
+            if not busy:
+                return
+
+            deadlines = [deadline for i in busy for deadline in _deadlines(slots[i], timeout, stage_timeout)]
+            wait_timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            ready = wait([slots[i].connection for i in busy], wait_timeout)
+
+            for i in busy:
+                slot = slots[i]
+                result = _receive(slot) if slot.connection in ready else None
+                if result is None:
+                    expired = _expired(slot, timeout, stage_timeout)
+                    if expired:
+                        result = slot.finish('timeout', f"Exceeded {expired} time budget",
+                                             timed_out_stage=slot.pending_stage())
+                        slot.broken = True
+                if result is not None:
+                    if slot.broken:
+                        slot.kill()
+                        slots[i] = None
+                    yield result
+    finally:
+        for slot in slots:
+            if slot is not None:
+                slot.shutdown()
+
+
+def _deadlines(slot, timeout, stage_timeout):
+    if slot.task['started'] is None:
+        return
+    if timeout is not None:
+        yield slot.task['started'] + timeout
+    if stage_timeout is not None:
+        yield slot.task['stage_started'] + stage_timeout
+
+
+def _expired(slot, timeout, stage_timeout):
+    if slot.task['started'] is None:
+        return None
+    now = time.monotonic()
+    if timeout is not None and now >= slot.task['started'] + timeout:
+        return 'expression'
+    if stage_timeout is not None and now >= slot.task['stage_started'] + stage_timeout:
+        return 'stage'
+    return None
+
+
+def _receive(slot):
+    while slot.connection.poll():
+        try:
+            message = slot.connection.recv()
+        except (EOFError, OSError):
+            slot.broken = True
+            return slot.finish('error', "Worker process exited unexpectedly")
+        kind, index = message[0], message[1]
+        if index != slot.task['index']:
+            continue
+        if kind == 'start':
+            slot.task['started'] = slot.task['stage_started'] = time.monotonic()
+        elif kind == 'stage':
+            slot.task['results'][message[2]] = message[3]
+            slot.task['stage_started'] = time.monotonic()
+        elif kind == 'error':
+            return slot.finish('error', message[2])
+        elif kind == 'done':
+            return slot.finish('ok')
+    return None
@@ -0,0 +1,124 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+import sympy as sp
+
+from . import __version__
+
+
+class AnalysisCache:
+    """Persistent on-disk cache of analysis stage results.
+
+    Entries are keyed by a hash of the canonical form (``sp.srepr``) of the
+    parsed expression and the versions of the library and of SymPy, so
+    upgrading either never serves stale results. Each stage result is stored as its own entry. When
+    ``max_entries`` or ``max_bytes`` is given, the least recently used entries
+    are evicted to stay within the budget. To keep warm reads from taking the
+    write lock, a hit only refreshes the access time of an entry once it is
+    more than ``touch_interval`` seconds old, so recency is tracked at that
+    granularity.
+
+    The cache is backed by SQLite and is safe to share between threads and
+    processes; each thread of each process uses its own connection. Values
+    are pickled, so only point it at a directory you trust.
+    """
+
+    def __init__(self, path, max_entries=None, max_bytes=None, timeout=30.0, touch_interval=60.0):
+        self.path = os.path.expanduser(os.fspath(path))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+
+    def key(self, function, variant=''):
+        canonical = f"{__version__}:{sp.__version__}:{variant}:{sp.srepr(sp.sympify(function))}"
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key, stage):
+        """Return the cached result of ``stage`` for ``key``, or None on a miss."""
+        connection = self._connect()
+        with connection:
+            row = connection.execute(
+                "SELECT value, accessed FROM entries WHERE key = ? AND stage = ?", (key, stage)
+            ).fetchone()
+            if row is None:
+                return None
+            try:
+                value = pickle.loads(row[0])
+            except Exception:
+                connection.execute("DELETE FROM entries WHERE key = ? AND stage = ?", (key, stage))
+                return None
+            now = time.time()
+            if now - row[1] > self.touch_interval:
+                connection.execute(
+                    "UPDATE entries SET accessed = ? WHERE key = ? AND stage = ?", (now, key, stage)
+                )
+        return value
+
+    def set(self, key, stage, value):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, stage, value, size, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, stage, data, len(data), time.time())
+            )
+            self._evict(connection)
+
+    def clear(self):
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM entries")
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def total_bytes(self):
+        return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _evict(self, connection):
+        if self.max_entries is not None:
+            connection.execute(
+                "DELETE FROM entries WHERE rowid IN ("
+                "SELECT rowid FROM entries ORDER BY accessed DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+        if self.max_bytes is not None:
+            connection.execute(
+                "DELETE FROM entries WHERE rowid IN ("
+                "SELECT rowid FROM (SELECT rowid, SUM(size) OVER (ORDER BY accessed DESC, rowid DESC) AS total "
+                "FROM entries) WHERE total > ?)",
+                (self.max_bytes,)
+            )
+
+    def _connect(self):
+        # SQLite connections must not be shared with other threads or forked children.
+        local = self._local
+        if getattr(local, 'connection', None) is None or local.pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "key TEXT NOT NULL, stage TEXT NOT NULL, value BLOB NOT NULL, "
+                    "size INTEGER NOT NULL, accessed REAL NOT NULL, PRIMARY KEY (key, stage))"
+                )
+            local.connection = connection
+            local.pid = os.getpid()
+        return local.connection
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
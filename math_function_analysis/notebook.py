@@ -0,0 +1,12 @@
+"""LaTeX reports for Jupyter notebooks. Imported on first use so that IPython is optional."""
+from IPython.display import display, Latex
+
+
+def display_report(analysis):
+    for line in analysis.serialize().latex_report(analysis.language):
+        display(Latex(line))
+
+
+def step_by_step_analysis(analysis):
+    for step in analysis.serialize().latex_steps(analysis.language):
+        display(Latex(step))
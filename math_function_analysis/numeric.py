@@ -0,0 +1,194 @@
+import math
+
+import numpy as np
+import sympy as sp
+
+# Sampled values this small everywhere on an interval mean the expression is identically zero.
+ZERO_TOLERANCE = 1e-12
+
+
+def find_roots(expression, variable, domain=None, window=(-10, 10), samples=2001, tol=1e-12):
+    """Find the real roots of ``expression`` numerically.
+
+    The expression is evaluated on a vectorized grid over ``domain``
+    restricted to ``window``, every sign change is refined with Brent's
+    method, and roots closer than a relative tolerance are merged. Brackets
+    that straddle a pole rather than a root are discarded.
+
+    Roots outside ``window`` are not searched for, and roots where the
+    expression touches zero without changing sign (e.g. ``(x - 0.3)**2``)
+    are found only if they happen to fall on a grid point. An expression
+    that is zero (up to ``ZERO_TOLERANCE``) over a whole interval has no
+    isolated roots there, so none are returned. Open ends of the domain are
+    sampled slightly inside the interval, and exact zeros there are ignored.
+    """
+    if expression.is_zero:
+        return []
+    f = sp.lambdify(variable, expression, 'numpy')
+    roots = []
+    for start, end, left_open, right_open in _intervals(domain, window):
+        grid = np.linspace(start, end, samples)
+        values = _evaluate(f, grid)
+        finite = np.abs(values[np.isfinite(values)])
+        if finite.size and finite.max() <= ZERO_TOLERANCE:
+            # Identically zero up to rounding: no isolated roots here.
+            continue
+        zeros = values == 0
+        # An exact zero next to an excluded point (e.g. the removable singularity
+        # of sin(x)/x) is usually cancellation, not a root.
+        zeros[0] &= not left_open
+        zeros[-1] &= not right_open
+        roots.extend(grid[zeros])
+        signs = np.where(np.isfinite(values), np.sign(values), np.nan)
+        brackets = np.nonzero(signs[:-1] * signs[1:] < 0)[0]
+        for i in brackets:
+            a, b, fa, fb = grid[i], grid[i + 1], values[i], values[i + 1]
+            root = _brent(lambda t: _evaluate(f, t), a, b, fa, fb, tol)
+            value = _evaluate(f, root)
+            if np.isfinite(value) and abs(value) <= max(abs(fa), abs(fb)):
+                roots.append(root)
+    roots = [0.0 if abs(root) <= tol else root for root in roots]
+    return [sp.Float(root) for root in _deduplicate(sorted(roots))]
+
+
+def compile_function(expression, variable, domain=None):
+    """Compile ``expression`` into a vectorized NumPy evaluator.
+
+    The evaluator returns NaN wherever the result is not a finite real number
+    and, when ``domain`` is a union of intervals, at every point outside it.
+    """
+    f = sp.lambdify(variable, expression, 'numpy')
+    bounds = _domain_bounds(domain)
+
+    def evaluate(points):
+        points = np.asarray(points, dtype=float)
+        values = np.array(_evaluate(f, points), dtype=float)
+        values[~np.isfinite(values)] = np.nan
+        if bounds is not None:
+            values[~_contains(bounds, points)] = np.nan
+        return values if values.ndim else float(values)
+
+    return evaluate
+
+
+def real_points(values):
+    """Finite real values from a list of analysis results, as floats."""
+    if not isinstance(values, (list, tuple)):
+        return []
+    points = []
+    for value in values:
+        if not isinstance(value, (sp.Basic, int, float)):
+            continue
+        try:
+            point = float(value)
+        except TypeError:
+            continue
+        if np.isfinite(point):
+            points.append(point)
+    return points
+
+
+def _domain_bounds(domain):
+    if not isinstance(domain, sp.Set):
+        return None
+    parts = domain.args if isinstance(domain, sp.Union) else (domain,)
+    if not all(isinstance(part, sp.Interval) for part in parts):
+        return None
+    return [(float(part.start), float(part.end), part.left_open, part.right_open) for part in parts]
+
+
+def _contains(bounds, points):
+    inside = np.zeros(points.shape, dtype=bool)
+    for start, end, left_open, right_open in bounds:
+        above = points > start if left_open else points >= start
+        below = points < end if right_open else points <= end
+        inside |= above & below
+    return inside
+
+
+def _intervals(domain, window):
+    bounds = sp.Interval(*window)
+    if domain is None or not isinstance(domain, sp.Set):
+        region = bounds
+    else:
+        region = domain.intersect(bounds)
+    if isinstance(region, sp.Complement):
+        # Removed points (e.g. the poles of tan) are handled by the pole check.
+        region = region.args[0]
+    parts = region.args if isinstance(region, sp.Union) else (region,)
+    for part in parts:
+        if isinstance(part, sp.Interval) and part.measure > 0:
+            start, end = float(part.start), float(part.end)
+            # Open endpoints are usually poles or branch points; stay clear of them.
+            step = (end - start) * 1e-9
+            yield ((start + step if part.left_open else start), (end - step if part.right_open else end),
+                   bool(part.left_open), bool(part.right_open))
+
+
+def _evaluate(f, points):
+    with np.errstate(all='ignore'):
+        try:
+            values = f(points)
+        except (ZeroDivisionError, ValueError, TypeError):
+            values = np.vectorize(lambda point: _evaluate_scalar(f, point), otypes=[float])(points)
+    values = np.asarray(values)
+    if np.iscomplexobj(values):
+        values = np.where(np.abs(values.imag) <= 1e-12 * np.maximum(1, np.abs(values.real)), values.real, np.nan)
+    values = np.broadcast_to(values.astype(float), np.shape(points))
+    return values if np.ndim(values) else float(values)
+
+
+def _evaluate_scalar(f, point):
+    try:
+        value = complex(f(point))
+    except (ZeroDivisionError, ValueError, TypeError, OverflowError):
+        return math.nan
+    return value.real if abs(value.imag) <= 1e-12 * max(1, abs(value.real)) else math.nan
+
+
+def _brent(f, a, b, fa, fb, tol, maxiter=100):
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(maxiter):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, fa = b, fb
+            b, fb = c, fc
+            c, fc = a, fa
+        tolerance = 2 * np.finfo(float).eps * abs(b) + tol / 2
+        midpoint = (c - b) / 2
+        if abs(midpoint) <= tolerance or fb == 0:
+            return b
+        if abs(e) >= tolerance and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * midpoint * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * midpoint * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * midpoint * q - abs(tolerance * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = midpoint
+        else:
+            d = e = midpoint
+        a, fa = b, fb
+        b += d if abs(d) > tolerance else math.copysign(tolerance, midpoint)
+        fb = f(b)
+        if not np.isfinite(fb):
+            return b
+    return b
+
+
+def _deduplicate(roots, rtol=1e-8):
+    unique = []
+    for root in roots:
+        if not unique or abs(root - unique[-1]) > rtol * max(1.0, abs(root)):
+            unique.append(float(root))
+    return unique
@@ -0,0 +1,282 @@
+import numpy as np
+import sympy as sp
+
+from .analysis import MathFunctionAnalysis
+from .numeric import real_points
+
+
+class ParametricAnalysis:
+    """Analysis of a family of functions ``f(x, a, ...)`` with free parameters.
+
+    The symbolic work (derivatives, solutions for intercepts, critical and
+    inflection points, asymptote formulas) is done once with the parameters
+    left free. ``evaluate`` then compiles the closed forms and evaluates them
+    over NumPy arrays of parameter values. Rows where the closed forms do not
+    apply (a leading coefficient vanishes or a formula is singular) are marked
+    degenerate and analyzed individually with :class:`MathFunctionAnalysis`.
+    """
+
+    def __init__(self, function_str, parameters=None, language='ru'):
+        self.x = sp.symbols('x')
+        self.function = sp.sympify(function_str)
+        self.language = language
+        if parameters is None:
+            parameters = sorted(self.function.free_symbols - {self.x}, key=str)
+        self.parameters = tuple(sp.Symbol(p) if isinstance(p, str) else p for p in parameters)
+
+        self.first_derivative = sp.cancel(sp.diff(self.function, self.x))
+        self.second_derivative = sp.cancel(sp.diff(self.first_derivative, self.x))
+        self.numerator, self.denominator = sp.fraction(sp.cancel(self.function))
+        self.x_intercepts = self._solve(self.function)
+        self.y_intercept = self.function.subs(self.x, 0)
+        self.critical_points = self._solve(self.first_derivative)
+        self.inflection_points = self._solve(self.second_derivative)
+        self.vertical_asymptotes = self._solve(sp.denom(self.function))
+        self.horizontal_asymptotes = self._find_horizontal_asymptotes()
+        self.oblique_asymptote = self._find_oblique_asymptote()
+        self.degeneracies = self._find_degeneracies()
+        self._compiled = None
+
+    def _solve(self, expression):
+        try:
+            solutions = sp.solve(expression, self.x)
+        except Exception:
+            return None
+        if not isinstance(solutions, list) or any(solution.has(self.x) for solution in solutions):
+            return None
+        return solutions
+
+    def _polynomial(self, expression):
+        if not expression.is_polynomial(self.x):
+            return None
+        return sp.Poly(expression, self.x)
+
+    def _rational_form(self):
+        numerator, denominator = self._polynomial(self.numerator), self._polynomial(self.denominator)
+        if numerator is None or denominator is None:
+            return None
+        return numerator, denominator
+
+    def _find_horizontal_asymptotes(self):
+        """Limits at ``+oo`` and ``-oo`` as expressions in the parameters, or None if unknown."""
+        rational_form = self._rational_form()
+        if rational_form is not None:
+            numerator, denominator = rational_form
+            excess = numerator.degree() - denominator.degree()
+            ratio = numerator.LC() / denominator.LC()
+            if excess < 0:
+                return (sp.S.Zero, sp.S.Zero)
+            if excess == 0:
+                return (ratio, ratio)
+            # The sign of the infinite limit depends on the parameters.
+            return (sp.oo * sp.sign(ratio), sp.oo * sp.sign(ratio) * (-1) ** excess)
+        limits = []
+        for direction in (sp.oo, -sp.oo):
+            try:
+                limit = sp.limit(self.function, self.x, direction)
+            except Exception:
+                return None
+            if limit.has(self.x, sp.Limit, sp.AccumBounds):
+                return None
+            limits.append(limit)
+        return tuple(limits)
+
+    def _find_oblique_asymptote(self):
+        """Slope and intercept of a linear oblique asymptote, or None."""
+        rational_form = self._rational_form()
+        if rational_form is None:
+            return None
+        numerator, denominator = rational_form
+        if numerator.degree() - denominator.degree() != 1:
+            return None
+        quotient, remainder = numerator.div(denominator)
+        return tuple(quotient.all_coeffs())
+
+    def _find_degeneracies(self):
+        """Expressions in the parameters whose vanishing invalidates the closed forms."""
+        degeneracies = []
+        for expression in (self.numerator, self.denominator,
+                           sp.numer(self.first_derivative), sp.numer(self.second_derivative)):
+            poly = self._polynomial(expression)
+            if poly is not None and not poly.is_zero:
+                leading = poly.LC()
+                if leading.free_symbols:
+                    degeneracies.append(leading)
+        return degeneracies
+
+    def _compile(self):
+        if self._compiled is None:
+            point_sets = {
+                'x_intercepts': self.x_intercepts,
+                'critical_points': self.critical_points,
+                'inflection_points': self.inflection_points,
+                'vertical_asymptotes': self.vertical_asymptotes,
+            }
+            self._compiled = {
+                'points': {name: _lambdify(self.parameters, points)
+                           for name, points in point_sets.items() if points is not None},
+                'function': sp.lambdify((self.x,) + self.parameters, self.function, 'numpy'),
+                'y_intercept': _lambdify(self.parameters, [self.y_intercept]),
+                'horizontal_asymptotes': (_lambdify(self.parameters, self.horizontal_asymptotes)
+                                          if self.horizontal_asymptotes is not None else None),
+                'oblique_asymptote': (_lambdify(self.parameters, self.oblique_asymptote)
+                                      if self.oblique_asymptote is not None else None),
+                'degeneracies': _lambdify(self.parameters, self.degeneracies),
+            }
+        return self._compiled
+
+    def evaluate(self, **values):
+        """Evaluate the family over arrays of parameter values.
+
+        Parameter arrays are broadcast against each other and then flattened.
+        Returns a dict of columnar arrays with one row per parameter point:
+        ``x_intercepts``, ``critical_points``, ``extrema_values``,
+        ``inflection_points``, ``inflection_values`` and
+        ``vertical_asymptotes`` have one column per
+        solution, NaN where that solution is not real or (except for the
+        vertical asymptotes) not a point of the domain;
+        ``y_intercept``, ``horizontal_asymptotes`` (at ``+oo`` and ``-oo``,
+        NaN for non-degenerate rows when the limits have no closed form),
+        ``oblique_slope``, ``oblique_intercept`` and ``degenerate`` complete
+        the table.
+        """
+        missing = {str(parameter) for parameter in self.parameters} - set(values)
+        if missing:
+            raise ValueError(f"Missing values for parameters: {', '.join(sorted(missing))}")
+        arrays = [array.ravel() for array in np.broadcast_arrays(
+            *(np.asarray(values[str(parameter)], dtype=float) for parameter in self.parameters))]
+        size = arrays[0].size if arrays else 1
+        compiled = self._compile()
+        complex_arrays = [array.astype(complex) for array in arrays]
+
+        degenerate = np.zeros(size, dtype=bool)
+        for value in compiled['degeneracies'](arrays, size, float).T:
+            degenerate |= value == 0
+
+        results = {str(parameter): array for parameter, array in zip(self.parameters, arrays)}
+        function = compiled['function']
+        for name, values_name, in_domain in POINT_COLUMNS:
+            if name not in compiled['points']:
+                degenerate[:] = True
+                results[name] = np.full((size, 0), np.nan)
+                if values_name:
+                    results[values_name] = np.full((size, 0), np.nan)
+                continue
+            # Solutions are evaluated in complex arithmetic: a square root of
+            # a negative expression means the point does not exist.
+            points = compiled['points'][name](complex_arrays, size, complex)
+            degenerate |= ~np.all(np.isfinite(points), axis=1)
+            points = _distinct(_real(points))
+            if not in_domain:
+                results[name] = points
+                continue
+            with np.errstate(all='ignore'):
+                function_values = _real(np.stack(
+                    [_broadcast(function(column.astype(complex), *complex_arrays), size, complex)
+                     for column in points.T], axis=1)) if points.shape[1] else points.copy()
+            points[np.isnan(function_values)] = np.nan
+            results[name] = points
+            if values_name:
+                results[values_name] = function_values
+
+        results['y_intercept'] = _real(compiled['y_intercept'](complex_arrays, size, complex))[:, 0]
+        if compiled['horizontal_asymptotes'] is not None:
+            results['horizontal_asymptotes'] = compiled['horizontal_asymptotes'](arrays, size, float)
+        else:
+            # No closed form for the limits: leave them unknown rather than analyzing every row.
+            results['horizontal_asymptotes'] = np.full((size, 2), np.nan)
+        if compiled['oblique_asymptote'] is not None:
+            oblique = compiled['oblique_asymptote'](arrays, size, float)
+            results['oblique_slope'], results['oblique_intercept'] = oblique[:, 0], oblique[:, 1]
+        else:
+            results['oblique_slope'] = np.full(size, np.nan)
+            results['oblique_intercept'] = np.full(size, np.nan)
+
+        for row in np.nonzero(degenerate)[0]:
+            self._fill_row(results, row, {parameter: array[row] for parameter, array in zip(self.parameters, arrays)})
+        results['degenerate'] = degenerate
+        return results
+
+    def _fill_row(self, results, row, substitutions):
+        """Analyze one parameter point individually and store its results in ``row``."""
+        analysis = MathFunctionAnalysis(self.function.subs(substitutions), language=self.language)
+        first = analysis.first_derivative_analysis
+        second = analysis.second_derivative_analysis
+        columns = {
+            'x_intercepts': analysis.intercepts['x'],
+            'critical_points': first['critical_points'],
+            'extrema_values': [first['extrema_values'][point] for point in first['critical_points']
+                               if real_points([point])],
+            'inflection_points': second['inflection_points'],
+            'inflection_values': [second['inflection_values'][point] for point in second['inflection_points']
+                                  if real_points([point])],
+            'vertical_asymptotes': analysis.asymptotes['vertical'],
+        }
+        for name, values in columns.items():
+            points = real_points(values)
+            width = results[name].shape[1]
+            if len(points) > width:
+                padding = np.full((results[name].shape[0], len(points) - width), np.nan)
+                results[name] = np.concatenate([results[name], padding], axis=1)
+            results[name][row] = np.nan
+            results[name][row, :len(points)] = points
+        results['y_intercept'][row] = (real_points([analysis.intercepts['y']]) or [np.nan])[0]
+        results['horizontal_asymptotes'][row] = [_to_float(value) for value in analysis.asymptotes['horizontal']]
+        results['oblique_slope'][row] = np.nan
+        results['oblique_intercept'][row] = np.nan
+        oblique = analysis.asymptotes['oblique']
+        if isinstance(oblique, sp.Expr) and oblique.is_polynomial(self.x) and sp.degree(oblique, self.x) == 1:
+            slope, intercept = sp.Poly(oblique, self.x).all_coeffs()
+            results['oblique_slope'][row] = float(slope)
+            results['oblique_intercept'][row] = float(intercept)
+
+
+# (points column, column of function values at the points, whether the points must lie in the domain)
+POINT_COLUMNS = (
+    ('x_intercepts', None, True),
+    ('critical_points', 'extrema_values', True),
+    ('inflection_points', 'inflection_values', True),
+    ('vertical_asymptotes', None, False),
+)
+
+
+def _lambdify(parameters, expressions):
+    """Compile a list of expressions into a function returning a ``(size, len)`` array."""
+    expressions = list(expressions)
+    compiled = sp.lambdify(parameters, expressions, 'numpy')
+
+    def evaluate(arguments, size, dtype):
+        if not expressions:
+            return np.empty((size, 0), dtype=dtype)
+        with np.errstate(all='ignore'):
+            values = compiled(*arguments)
+        return np.stack([_broadcast(value, size, dtype) for value in values], axis=1)
+
+    return evaluate
+
+
+def _broadcast(value, size, dtype):
+    return np.broadcast_to(np.asarray(value, dtype=dtype), (size,))
+
+
+def _real(values):
+    """Real parts where the imaginary part is negligible and the value finite, NaN elsewhere."""
+    values = np.asarray(values, dtype=complex)
+    real = values.real.copy()
+    negligible = np.abs(values.imag) <= 1e-9 * np.maximum(1, np.abs(values.real))
+    real[~(negligible & np.isfinite(values))] = np.nan
+    return real
+
+
+def _distinct(points):
+    """Blank out columns that repeat an earlier solution in the same row."""
+    for j in range(1, points.shape[1]):
+        points[(points[:, :j] == points[:, j:j + 1]).any(axis=1), j] = np.nan
+    return points
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
@@ -0,0 +1,121 @@
+import io
+
+import numpy as np
+import sympy as sp
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .numeric import _evaluate, real_points
+
+DEFAULT_RANGE = (-10, 10)
+
+
+def features(analysis):
+    """Points of interest of the graph: poles, extrema, inflection points and x-intercepts."""
+    return {
+        'poles': real_points(analysis.asymptotes['vertical']),
+        'extrema': real_points(analysis.first_derivative_analysis['critical_points']),
+        'inflections': real_points(analysis.second_derivative_analysis['inflection_points']),
+        'intercepts': real_points(analysis.intercepts['x']),
+    }
+
+
+def auto_range(analysis, margin=0.5, min_span=10.0):
+    """Pick an x-range that shows every point of interest, clipped to the domain."""
+    points = [point for group in features(analysis).values() for point in group]
+    if points:
+        start, end = min(points), max(points)
+        padding = max(end - start, min_span) * margin
+        start, end = start - padding, end + padding
+    else:
+        start, end = DEFAULT_RANGE
+    domain = analysis.domain
+    if isinstance(domain, sp.Set) and not domain.is_empty:
+        if domain.inf.is_finite:
+            start = max(start, float(domain.inf))
+        if domain.sup.is_finite:
+            end = min(end, float(domain.sup))
+    return start, end
+
+
+def sample(analysis, x_range, points=400):
+    """Sample x-values: a uniform grid refined near asymptotes, extrema and inflection points."""
+    start, end = x_range
+    width = (end - start) / 20
+    found = features(analysis)
+    xs = [np.linspace(start, end, points)]
+    near = np.geomspace(1e-6, 1, points // 8) * width
+    for pole in found['poles']:
+        xs.append(np.concatenate([pole - near, [pole], pole + near]))
+    around = np.linspace(-width, width, points // 16)
+    for point in found['extrema'] + found['inflections']:
+        xs.append(point + around)
+    xs = np.concatenate(xs)
+    return np.unique(xs[(xs >= start) & (xs <= end)])
+
+
+def evaluate(analysis, xs):
+    """Evaluate the function on ``xs``, with NaN at poles and wherever the value is not finite real."""
+    ys = np.array(analysis.evaluator()(xs), dtype=float)
+    ys[np.isin(xs, real_points(analysis.asymptotes['vertical']))] = np.nan
+    return ys
+
+
+def draw(ax, analysis, x_range=None, points=400):
+    x_range = x_range or auto_range(analysis)
+    xs = sample(analysis, x_range, points)
+    ys = evaluate(analysis, xs)
+    translate = analysis._translate
+    ax.plot(xs, ys, label=translate('Function'))
+
+    y_intercept = analysis.intercepts['y']
+    if real_points([y_intercept]) and y_intercept:
+        ax.scatter([0], [float(y_intercept)], color='red', label=translate('Y-intercept'))
+    x_intercepts = real_points(analysis.intercepts['x'])
+    if x_intercepts:
+        ax.scatter(x_intercepts, np.zeros(len(x_intercepts)), color='green', label=translate('X-intercept'))
+
+    poles = real_points(analysis.asymptotes['vertical'])
+    for pole in poles:
+        ax.axvline(pole, color='purple', linestyle='--', label=f"{translate('Vertical Asymptote at x=')} {pole:g}")
+    for level in sorted(set(real_points(analysis.asymptotes['horizontal']))):
+        ax.axhline(level, color='orange', linestyle='--', label=f"{translate('Horizontal Asymptote at y=')} {level:g}")
+
+    oblique = analysis.asymptotes['oblique']
+    if isinstance(oblique, sp.Expr):
+        y_oblique = _evaluate(sp.lambdify(analysis.x, oblique, 'numpy'), xs)
+        ax.plot(xs, y_oblique, color='brown', linestyle='--', label=translate('Oblique Asymptote'))
+
+    if poles:
+        # Values blow up next to poles; frame the bulk of the uniformly sampled graph instead.
+        uniform = evaluate(analysis, np.linspace(x_range[0], x_range[1], points))
+        finite = uniform[np.isfinite(uniform)]
+        if finite.size:
+            low, high = np.percentile(finite, [5, 95])
+            padding = max(high - low, 1.0) * 0.5
+            ax.set_ylim(low - padding, high + padding)
+    ax.set_xlim(*x_range)
+
+    ax.axhline(0, color='black', linewidth=0.8)
+    ax.axvline(0, color='black', linewidth=0.8)
+    ax.grid(color='gray', linestyle='--', linewidth=0.5)
+    ax.set_title(translate('Function Analysis Plot'))
+    ax.set_xlabel(translate('x'))
+    ax.set_ylabel(translate('y'))
+    ax.legend()
+
+
+def render(analysis, path=None, format='png', x_range=None, points=400, figsize=(10, 6), dpi=100):
+    """Render the plot without a GUI backend.
+
+    Writes the image to ``path`` if given, otherwise returns it as bytes.
+    """
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    draw(figure.add_subplot(), analysis, x_range, points)
+    if path is not None:
+        figure.savefig(path, format=format)
+        return None
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=format)
+    return buffer.getvalue()
@@ -0,0 +1,94 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class StageStats:
+    """Accumulated measurements of one pipeline stage."""
+
+    __slots__ = ('name', 'calls', 'wall_time', 'peak_memory')
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall_time = 0.0
+        self.peak_memory = None
+
+    def as_dict(self):
+        return {'calls': self.calls, 'wall_time': self.wall_time, 'peak_memory': self.peak_memory}
+
+    def __repr__(self):
+        return (f"StageStats({self.name!r}, calls={self.calls}, wall_time={self.wall_time:.6f}, "
+                f"peak_memory={self.peak_memory})")
+
+
+class AnalysisStats:
+    """Per-stage wall time, call counts and (optionally) peak memory of an analysis.
+
+    Stages nest, so the time of a stage includes the time of the intermediates
+    it computed. Hooks are called as ``hook(stage, wall_time, peak_memory)``
+    after every measurement, which makes it easy to forward the data to a
+    metrics system.
+
+    With ``memory=True``, ``tracemalloc`` is started when an outermost stage
+    begins and stopped again when it ends, unless it was already tracing.
+    """
+
+    def __init__(self, hooks=(), memory=False):
+        self.stages = {}
+        self.hooks = list(hooks)
+        self.memory = memory
+        self._memory_stack = []
+        self._started_tracing = False
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    @contextmanager
+    def measure(self, name):
+        if self.memory:
+            if not self._memory_stack and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            frame = [current, 0]
+            self._memory_stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = None
+            if self.memory:
+                self._memory_stack.pop()
+                peak = max(tracemalloc.get_traced_memory()[1] - frame[0], frame[1])
+                if self._memory_stack:
+                    # The parent's peak was reset when this stage started; carry it over.
+                    parent = self._memory_stack[-1]
+                    parent[1] = max(parent[1], frame[0] - parent[0] + peak)
+                elif self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+            self.record(name, elapsed, peak)
+
+    def record(self, name, wall_time, peak_memory=None):
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        stats.calls += 1
+        stats.wall_time += wall_time
+        if peak_memory is not None:
+            stats.peak_memory = max(stats.peak_memory or 0, peak_memory)
+        for hook in self.hooks:
+            hook(name, wall_time, peak_memory)
+
+    def as_dict(self):
+        return {name: stats.as_dict() for name, stats in self.stages.items()}
+
+    def __str__(self):
+        lines = [f"{'stage':<32}{'calls':>7}{'wall time, s':>15}{'peak memory, B':>17}"]
+        for stats in sorted(self.stages.values(), key=lambda stats: -stats.wall_time):
+            memory = '' if stats.peak_memory is None else stats.peak_memory
+            lines.append(f"{stats.name:<32}{stats.calls:>7}{stats.wall_time:>15.6f}{memory:>17}")
+        return '\n'.join(lines)
@@ -0,0 +1,137 @@
+"""Polynomial algorithms for rational functions.
+
+A rational expression is represented by its numerator and denominator as
+``sp.Poly`` objects with exact (integer or rational) coefficients. The
+functions here reproduce the results of the general ``sp.solve``/``sp.limit``
+based analysis using polynomial arithmetic only.
+
+Real roots used for computation (interval splitting and sign tests) are
+isolated with Sturm sequences via ``Poly.real_roots``. Closed forms are only
+built for the points that are displayed, and only for irreducible factors of
+degree up to ``RADICAL_MAX_DEGREE``; other roots are kept as ``CRootOf``.
+"""
+import sympy as sp
+from sympy import default_sort_key
+
+# Radicals for higher degrees are either impossible or far too slow to build.
+RADICAL_MAX_DEGREE = 4
+
+
+def as_rational(expression, variable):
+    """Return ``(numerator, denominator)`` as exact polynomials, or None if not rational."""
+    if expression.free_symbols - {variable}:
+        return None
+    numerator, denominator = sp.numer(expression), sp.denom(expression)
+    if not (numerator.is_polynomial(variable) and denominator.is_polynomial(variable)):
+        return None
+    try:
+        numerator, denominator = sp.Poly(numerator, variable), sp.Poly(denominator, variable)
+    except sp.PolynomialError:
+        return None
+    if not all(poly.domain.is_ZZ or poly.domain.is_QQ for poly in (numerator, denominator)):
+        return None
+    return numerator, denominator
+
+
+def roots(numerator, denominator):
+    """Solutions of ``numerator / denominator = 0`` in the order ``sp.solve`` returns them."""
+    if numerator.is_zero:
+        return []
+    return polynomial_roots(_without_poles(numerator, denominator))
+
+
+def sorted_real_roots(numerator, denominator):
+    """Real solutions of ``numerator / denominator = 0`` as sorted Floats, from isolated roots."""
+    if numerator.is_zero:
+        return []
+    reduced = _without_poles(numerator, denominator)
+    if reduced.degree() <= 0:
+        return []
+    return [root.evalf() for root in reduced.sqf_part().real_roots()]
+
+
+def polynomial_roots(poly):
+    """Distinct complex roots of ``poly``, in radicals where feasible and as ``CRootOf`` otherwise."""
+    found = []
+    for factor in _irreducible_factors(poly):
+        found.extend(_factor_roots(factor, real=False))
+    return sorted(found, key=default_sort_key)
+
+
+def real_roots(poly):
+    """Distinct real roots of ``poly``, in radicals where feasible and as ``CRootOf`` otherwise."""
+    found = []
+    for factor in _irreducible_factors(poly):
+        found.extend(_factor_roots(factor, real=True))
+    return sorted(found, key=default_sort_key)
+
+
+def domain(denominator):
+    """Real line without the real zeros of ``denominator``."""
+    return sp.S.Reals - sp.FiniteSet(*real_roots(denominator))
+
+
+def _without_poles(numerator, denominator):
+    # Strip every factor shared with the denominator so that no root is a pole.
+    common = sp.gcd(numerator, denominator)
+    while common.degree() > 0:
+        numerator = sp.quo(numerator, common)
+        common = sp.gcd(numerator, denominator)
+    return numerator
+
+
+def _irreducible_factors(poly):
+    if poly.degree() <= 0:
+        return []
+    return [factor for factor, _ in poly.factor_list()[1]]
+
+
+def _factor_roots(factor, real):
+    """Roots of the irreducible ``factor``; with ``real``, only the real ones."""
+    if factor.degree() <= RADICAL_MAX_DEGREE:
+        found = list(sp.roots(factor))
+        if len(found) == factor.degree():
+            if not real:
+                return found
+            # Sturm's theorem tells how many real roots there are, so an
+            # undecidable radical does not go missing unnoticed.
+            real_found = [root for root in found if root.is_real]
+            if len(real_found) == factor.count_roots():
+                return real_found
+    return factor.real_roots() if real else factor.all_roots()
+
+
+def limits_at_infinity(numerator, denominator):
+    """Limits at ``+oo`` and ``-oo`` from the degrees and leading coefficients."""
+    if numerator.is_zero:
+        return (sp.S.Zero, sp.S.Zero)
+    excess = numerator.degree() - denominator.degree()
+    ratio = numerator.LC() / denominator.LC()
+    if excess < 0:
+        return (sp.S.Zero, sp.S.Zero)
+    if excess == 0:
+        return (ratio, ratio)
+    at_pos_inf = sp.oo if ratio > 0 else -sp.oo
+    at_neg_inf = at_pos_inf if excess % 2 == 0 else -at_pos_inf
+    return (at_pos_inf, at_neg_inf)
+
+
+def oblique_asymptote(numerator, denominator):
+    """Polynomial part of the function when the numerator has the higher degree, else None."""
+    if numerator.degree() > denominator.degree():
+        quotient, remainder = numerator.div(denominator)
+        return quotient.as_expr()
+    return None
+
+
+def sign(numerator, denominator, point):
+    """Sign of ``numerator / denominator`` at ``point``, or None at a pole."""
+    denominator_value = denominator.eval(point)
+    if denominator_value == 0:
+        return None
+    value = numerator.eval(point) * denominator_value
+    if value.is_positive:
+        return 1
+    if value.is_negative:
+        return -1
+    return 0
@@ -0,0 +1,195 @@
+"""Serializable analysis results.
+
+An :class:`AnalysisResult` stores the output of every analysis stage as plain
+data: each value is kept as its exact ``srepr``, a float approximation and
+pre-rendered LaTeX, and each stage also keeps the text that :meth:`report`
+shows. Results round-trip through JSON or a compressed binary form, and
+reports render in any language from the stored data without SymPy work.
+
+Schema (version 1)::
+
+    {"schema": "math_function_analysis.result", "version": 1,
+     "function": <value>, "mode": "symbolic",
+     "stages": {"<stage>": {"text": "<str(result)>", "data": <node>}}}
+
+A node is a value ``{"s": srepr, "f": float | [start, end] | null, "l": latex}``,
+a list of nodes, an object of named nodes, or ``{"map": [[node, node], ...]}``
+for a mapping keyed by values (e.g. extrema).
+"""
+import json
+import math
+import zlib
+
+import sympy as sp
+
+from .translations import translate
+
+SCHEMA = 'math_function_analysis.result'
+SCHEMA_VERSION = 1
+MAGIC = b'MFAR'
+
+
+class AnalysisResult:
+    """Stage results of an analysis in a compact, versioned, serializable form."""
+
+    def __init__(self, function, stages, mode='symbolic'):
+        self.function = function
+        self.stages = stages
+        self.mode = mode
+
+    @classmethod
+    def from_results(cls, function, results, mode='symbolic'):
+        """Encode stage results (as returned by ``MathFunctionAnalysis.compute``)."""
+        stages = {name: {'text': str(result), 'data': encode(result)} for name, result in results.items()}
+        return cls(encode(function), stages, mode)
+
+    @classmethod
+    def from_analysis(cls, analysis, stages=None):
+        return cls.from_results(analysis.function, analysis.compute(stages), analysis.mode)
+
+    def to_dict(self):
+        return {'schema': SCHEMA, 'version': SCHEMA_VERSION, 'function': self.function,
+                'mode': self.mode, 'stages': self.stages}
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('schema') != SCHEMA:
+            raise ValueError("Not an analysis result")
+        if data.get('version') != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported result schema version: {data.get('version')}")
+        return cls(data['function'], data['stages'], data.get('mode', 'symbolic'))
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
+
+    def to_bytes(self):
+        """zlib-compressed JSON behind a 4-byte magic header."""
+        return MAGIC + zlib.compress(self.to_json().encode('utf-8'), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a serialized analysis result")
+        return cls.from_json(zlib.decompress(data[len(MAGIC):]).decode('utf-8'))
+
+    def __eq__(self, other):
+        return isinstance(other, AnalysisResult) and self.to_dict() == other.to_dict()
+
+    def _stage(self, name):
+        try:
+            return self.stages[name]
+        except KeyError:
+            raise KeyError(f"Stage not stored in this result: {name}") from None
+
+    def report(self, language='ru'):
+        """Plain-text report, as ``MathFunctionAnalysis.report``."""
+        labels = (('Domain', 'domain'), ('Intercepts', 'intercepts'), ('Asymptotes', 'asymptotes'),
+                  ('First Derivative Analysis', 'first_derivative_analysis'),
+                  ('Second Derivative Analysis', 'second_derivative_analysis'))
+        return ''.join(f"{translate(label, language)}: {self._stage(name)['text']}\n" for label, name in labels)
+
+    def latex_report(self, language='ru'):
+        """LaTeX lines of ``MathFunctionAnalysis.display_report``."""
+        t = lambda key: translate(key, language)  # noqa: E731
+        domain = self._stage('domain')['data']
+        intercepts = self._stage('intercepts')['data']
+        asymptotes = self._stage('asymptotes')['data']
+        first = self._stage('first_derivative_analysis')['data']
+        second = self._stage('second_derivative_analysis')['data']
+        return [
+            "\\textbf{{{}}}:".format(t('Domain')) + " {}".format(domain['l']),
+            "\\textbf{{{}}}:".format(t('Intercepts')) +
+            " X: {}, Y: {}".format(_joined(intercepts['x']), intercepts['y']['l']),
+            "\\textbf{{{}}}:".format(t('Asymptotes')) +
+            " {}: {}, {}: {}, {}: {}".format(t('Vertical'), _joined(asymptotes['vertical']),
+                                             t('Horizontal'), _joined(asymptotes['horizontal']),
+                                             t('Oblique'), asymptotes['oblique']['l']),
+            "\\textbf{{{}}}:".format(t('First Derivative Analysis')) +
+            " {}: {}, {}: {}, {}: {}, {}: {}".format(t('Derivative'), first['derivative']['l'],
+                                                     t('Critical Points'), _joined(first['critical_points']),
+                                                     t('Increasing Intervals'), _joined(first['increasing_intervals']),
+                                                     t('Decreasing Intervals'), _joined(first['decreasing_intervals'])),
+            "\\textbf{{{}}}:".format(t('Second Derivative Analysis')) +
+            " {}: {}, {}: {}, {}: {}, {}: {}".format(t('Derivative'), second['derivative']['l'],
+                                                     t('Inflection Points'), _joined(second['inflection_points']),
+                                                     t('Concave Up Intervals'), _joined(second['concave_up_intervals']),
+                                                     t('Concave Down Intervals'), _joined(second['concave_down_intervals'])),
+        ]
+
+    def latex_steps(self, language='ru'):
+        """LaTeX lines of ``MathFunctionAnalysis.step_by_step_analysis``."""
+        t = lambda key: translate(key, language)  # noqa: E731
+        intercepts = self._stage('intercepts')['data']
+        asymptotes = self._stage('asymptotes')['data']
+        first = self._stage('first_derivative_analysis')['data']
+        second = self._stage('second_derivative_analysis')['data']
+        return [
+            "\\textbf{{{0}}}: {1}".format(t('Domain'), self._stage('domain')['data']['l']),
+            "\\textbf{{{0}}}: X: {1}, Y: {2}".format(t('Intercepts'), _joined(intercepts['x']), intercepts['y']['l']),
+            "\\textbf{{{0}}}: {1}: {2}, {3}: {4}, {5}: {6}".format(t('Asymptotes'),
+                                                                   t('Vertical'), _joined(asymptotes['vertical']),
+                                                                   t('Horizontal'), _joined(asymptotes['horizontal']),
+                                                                   t('Oblique'), asymptotes['oblique']['l']),
+            "\\textbf{{{0}}}:".format(t('First Derivative Analysis')),
+            "\\quad {0}: {1}".format(t('Derivative'), first['derivative']['l']),
+            "\\quad {0}: {1}".format(t('Critical Points'), _joined(first['critical_points'])),
+            "\\quad {0}: {1}".format(t('Increasing Intervals'), _joined(first['increasing_intervals'])),
+            "\\quad {0}: {1}".format(t('Decreasing Intervals'), _joined(first['decreasing_intervals'])),
+            "\\quad {0}: {1}".format(t('Extrema Values'), _joined_values(first['extrema_values'])),
+            "\\textbf{{{0}}}:".format(t('Second Derivative Analysis')),
+            "\\quad {0}: {1}".format(t('Derivative'), second['derivative']['l']),
+            "\\quad {0}: {1}".format(t('Inflection Points'), _joined(second['inflection_points'])),
+            "\\quad {0}: {1}".format(t('Concave Up Intervals'), _joined(second['concave_up_intervals'])),
+            "\\quad {0}: {1}".format(t('Concave Down Intervals'), _joined(second['concave_down_intervals'])),
+            "\\quad {0}: {1}".format(t('Inflection Values'), _joined_values(second['inflection_values'])),
+        ]
+
+
+def encode(value):
+    """Encode an analysis result (nested dicts, lists and values) as schema nodes."""
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: encode(item) for key, item in value.items()}
+        return {'map': [[encode(key), encode(item)] for key, item in value.items()]}
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    return {'s': sp.srepr(value), 'f': _approximate(value), 'l': sp.latex(value)}
+
+
+def decode(node):
+    """Rebuild the SymPy value of a value node from its ``srepr``.
+
+    This evaluates the stored text, so only decode results from trusted sources.
+    """
+    return sp.sympify(node['s'])
+
+
+def _approximate(value):
+    if isinstance(value, sp.Interval):
+        return [_float(value.start), _float(value.end)]
+    if isinstance(value, (sp.Basic, int, float)):
+        return _float(value)
+    return None
+
+
+def _float(value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _joined(node):
+    if isinstance(node, list):
+        return ', '.join(item['l'] for item in node)
+    return node['l']
+
+
+def _joined_values(node):
+    pairs = node['map'] if 'map' in node else []
+    return ', '.join("${}$: ${}$".format(key['l'], value['l']) for key, value in pairs)
@@ -0,0 +1,168 @@
+"""Minimal HTTP/JSON server on top of :class:`AnalysisService`.
+
+Run it with ``python -m math_function_analysis.server --port 8000`` and query
+
+    GET  /analyze?expression=1/(x**2-1)&stages=domain,asymptotes
+    POST /analyze   {"expression": "1/(x**2-1)", "stages": ["domain", "asymptotes"]}
+
+The response is an :class:`AnalysisResult` in its versioned JSON schema; with
+``format=binary`` it is the compressed binary form instead. With
+``language=ru`` or ``language=en`` (and all stages) the JSON also carries the
+rendered text ``report`` and LaTeX ``steps``. Errors are reported as
+``{"error": ...}`` with status 400 for invalid input, 503 when the service is
+busy and 500 when the analysis fails. Expressions are parsed with
+``sp.sympify``, which evaluates Python code, so do not expose the server to
+untrusted clients.
+"""
+import argparse
+import asyncio
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import sympy as sp
+
+from .analysis import MathFunctionAnalysis
+from .cache import AnalysisCache
+from .service import AnalysisService, ServiceBusy
+
+MAX_BODY = 64 * 1024
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+async def _read_request(reader):
+    request_line = (await reader.readline()).decode('latin-1').strip()
+    method, target, _ = request_line.split(' ', 2)
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode('latin-1').strip()
+        if not line:
+            break
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length', 0))
+    if length > MAX_BODY:
+        raise _HTTPError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b''
+    return method, target, body
+
+
+class _HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _parse_query(method, target, body):
+    url = urlsplit(target)
+    if url.path != '/analyze':
+        raise _HTTPError(404, f"Unknown path: {url.path}")
+    if method == 'GET':
+        query = parse_qs(url.query)
+        options = {name: values[0] for name, values in query.items()}
+        stages = options.get('stages')
+        options['stages'] = stages.split(',') if stages else None
+    elif method == 'POST':
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError as e:
+            raise _HTTPError(400, f"Invalid JSON: {e}")
+        if not isinstance(payload, dict):
+            raise _HTTPError(400, "Expected a JSON object")
+        options = payload
+    else:
+        raise _HTTPError(405, f"Unsupported method: {method}")
+    expression = options.get('expression')
+    if not isinstance(expression, str) or not expression:
+        raise _HTTPError(400, "Missing 'expression'")
+    if options.get('format', 'json') not in ('json', 'binary'):
+        raise _HTTPError(400, f"Unknown format: {options['format']}")
+    if options.get('language', 'ru') not in ('ru', 'en'):
+        raise _HTTPError(400, f"Unknown language: {options['language']}")
+    return expression, options
+
+
+async def handle(service, method, target, body):
+    """Answer one request; return ``(status, payload)`` with a JSON-compatible or bytes payload."""
+    try:
+        expression, options = _parse_query(method, target, body)
+        result = await service.analyze(expression, options.get('stages'), serialized=True)
+        if options.get('format') == 'binary':
+            return 200, result.to_bytes()
+        payload = result.to_dict()
+        if 'language' in options:
+            payload['report'] = result.report(options['language'])
+            payload['steps'] = result.latex_steps(options['language'])
+    except _HTTPError as e:
+        return e.status, {'error': str(e)}
+    except ServiceBusy as e:
+        return 503, {'error': str(e)}
+    except (ValueError, TypeError, KeyError, sp.SympifyError) as e:
+        return 400, {'error': str(e)}
+    except Exception as e:
+        return 500, {'error': f"{type(e).__name__}: {e}"}
+    return 200, payload
+
+
+async def _serve_connection(service, reader, writer):
+    try:
+        try:
+            method, target, body = await _read_request(reader)
+        except _HTTPError as e:
+            status, payload = e.status, {'error': str(e)}
+        except (ValueError, asyncio.IncompleteReadError):
+            status, payload = 400, {'error': "Malformed request"}
+        else:
+            status, payload = await handle(service, method, target, body)
+        if isinstance(payload, bytes):
+            content, content_type = payload, 'application/octet-stream'
+        else:
+            content = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+        writer.write(f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                     f"Content-Type: {content_type}\r\n"
+                     f"Content-Length: {len(content)}\r\n"
+                     f"Connection: close\r\n\r\n".encode('latin-1') + content)
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(service, host='127.0.0.1', port=8000):
+    """Start serving ``service`` and return the ``asyncio.Server``."""
+    return await asyncio.start_server(lambda reader, writer: _serve_connection(service, reader, writer), host, port)
+
+
+async def serve(host='127.0.0.1', port=8000, max_workers=None, max_pending=64, mode='symbolic', cache=None,
+                max_expression_length=1000):
+    async with AnalysisService(max_workers, max_pending, mode, cache,
+                               max_expression_length=max_expression_length) as service:
+        server = await start_server(service, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve function analyses over HTTP/JSON.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--max-pending', type=int, default=64, help="distinct analyses in flight before 503")
+    parser.add_argument('--max-expression-length', type=int, default=1000,
+                        help="longest accepted expression in characters")
+    parser.add_argument('--mode', choices=MathFunctionAnalysis.MODES, default='symbolic')
+    parser.add_argument('--cache', metavar='PATH', help="SQLite file for a persistent result cache")
+    args = parser.parse_args(argv)
+    cache = AnalysisCache(args.cache) if args.cache else None
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_pending, args.mode, cache,
+                          args.max_expression_length))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import sympy as sp
+
+from .analysis import MathFunctionAnalysis
+
+
+class ServiceBusy(RuntimeError):
+    """Raised when an :class:`AnalysisService` already has ``max_pending`` computations in flight."""
+
+
+def _canonicalize(function_str):
+    expression = sp.sympify(function_str)
+    return expression, sp.srepr(expression)
+
+
+def _analyze(expression, stages, mode, cache, serialized=False):
+    analysis = MathFunctionAnalysis(expression, cache=cache, mode=mode)
+    if serialized:
+        return analysis.serialize(stages)
+    return analysis.compute(stages)
+
+
+class _Flight:
+    def __init__(self, future):
+        self.future = future
+        self.waiters = 0
+
+
+class AnalysisService:
+    """Asyncio front end that runs analyses in a bounded executor.
+
+    Concurrent requests for the same expression and stages are coalesced into
+    a single computation; expressions are compared after ``sp.sympify``, so
+    ``"x + 1"`` and ``"1+x"`` share one. Parsing can be arbitrarily expensive
+    (``"9**9**9"``), so it runs in the executor too, shared by concurrent
+    requests for the same string. At most ``max_pending`` distinct
+    computations, parses included, are in flight at a time; further requests
+    raise :class:`ServiceBusy` instead of queueing without bound. Cancelling a
+    request only cancels the computation when no other request is waiting for
+    it; a computation that has already started keeps its worker busy until
+    it finishes. Expressions longer than ``max_expression_length``
+    characters are rejected with ``ValueError``.
+    """
+
+    def __init__(self, max_workers=None, max_pending=64, mode='symbolic', cache=None, executor=None,
+                 max_expression_length=1000):
+        if mode not in MathFunctionAnalysis.MODES:
+            raise ValueError(f"Unknown mode: {mode}")
+        self.max_pending = max_pending
+        self.mode = mode
+        self.cache = cache
+        self.max_expression_length = max_expression_length
+        self._own_executor = executor is None
+        self._executor = executor or ProcessPoolExecutor(max_workers)
+        self._parsing = {}
+        self._flights = {}
+
+    @property
+    def pending(self):
+        """Number of distinct computations (analyses and parses) in flight."""
+        return len(self._parsing) + len(self._flights)
+
+    async def analyze(self, function_str, stages=None, serialized=False):
+        """Analyze ``function_str`` and return the results of ``stages`` (all by default) by name.
+
+        With ``serialized=True`` the worker returns an :class:`AnalysisResult`
+        instead, so that LaTeX rendering also happens off the event loop.
+        """
+        if stages is None:
+            stages = MathFunctionAnalysis.STAGES
+        elif isinstance(stages, str):
+            stages = (stages,)
+        stages = tuple(stages)
+        for stage in stages:
+            if stage not in MathFunctionAnalysis._STAGE_METHODS:
+                raise ValueError(f"Unknown analysis stage: {stage}")
+        if isinstance(function_str, str) and len(function_str) > self.max_expression_length:
+            raise ValueError(f"Expression longer than {self.max_expression_length} characters")
+        loop = asyncio.get_running_loop()
+        expression, canonical = await self._join(
+            self._parsing, function_str, self.pending,
+            lambda: loop.run_in_executor(self._executor, _canonicalize, function_str)
+        )
+        # A finished parse may not have landed yet; it must not count against its own analysis.
+        results = await self._join(
+            self._flights, (canonical, stages, serialized), len(self._flights),
+            lambda: loop.run_in_executor(self._executor, _analyze, expression, stages, self.mode, self.cache,
+                                         serialized)
+        )
+        return results if serialized else dict(results)
+
+    async def _join(self, flights, key, in_flight, start):
+        """Await the flight for ``key`` in ``flights``, starting it with ``start()`` if there is none."""
+        flight = flights.get(key)
+        if flight is None:
+            if in_flight >= self.max_pending:
+                raise ServiceBusy(f"{in_flight} analyses already in progress")
+            future = start()
+            flight = flights[key] = _Flight(future)
+            future.add_done_callback(lambda _: self._land(flights, key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.future)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.future.done():
+                flight.future.cancel()
+
+    def _land(self, flights, key, flight):
+        if flights.get(key) is flight:
+            del flights[key]
+
+    def close(self, wait=True):
+        """Shut down the executor if the service created it."""
+        if self._own_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close(wait=False)
+
+
+_default_service = None
+
+
+async def analyze_async(function_str, stages=None, serialized=False):
+    """Analyze ``function_str`` off the event loop with a shared default :class:`AnalysisService`."""
+    global _default_service
+    if _default_service is None:
+        _default_service = AnalysisService()
+    return await _default_service.analyze(function_str, stages, serialized)
@@ -0,0 +1,33 @@
+TRANSLATIONS = {
+    'Domain': {'ru': 'Область определения', 'en': 'Domain'},
+    'Intercepts': {'ru': 'Пересечения с осями', 'en': 'Intercepts'},
+    'Asymptotes': {'ru': 'Асимптоты', 'en': 'Asymptotes'},
+    'Vertical': {'ru': 'Вертикальные', 'en': 'Vertical'},
+    'Horizontal': {'ru': 'Горизонтальные', 'en': 'Horizontal'},
+    'Oblique': {'ru': 'Наклонные', 'en': 'Oblique'},
+    'Function': {'ru': 'Функция', 'en': 'Function'},
+    'Y-intercept': {'ru': 'Пересечение с осью Y', 'en': 'Y-intercept'},
+    'X-intercept': {'ru': 'Пересечение с осью X', 'en': 'X-intercept'},
+    'Vertical Asymptote at x=': {'ru': 'Вертикальная асимптота в x=', 'en': 'Vertical Asymptote at x='},
+    'Horizontal Asymptote at y=': {'ru': 'Горизонтальная асимптота в y=', 'en': 'Horizontal Asymptote at y='},
+    'Oblique Asymptote': {'ru': 'Наклонная асимптота', 'en': 'Oblique Asymptote'},
+    'Function Analysis Plot': {'ru': 'График функции', 'en': 'Function Analysis Plot'},
+    'x': {'ru': 'x', 'en': 'x'},
+    'y': {'ru': 'y', 'en': 'y'},
+    'First Derivative Analysis': {'ru': 'Анализ первой производной', 'en': 'First Derivative Analysis'},
+    'Derivative': {'ru': 'Производная', 'en': 'Derivative'},
+    'Critical Points': {'ru': 'Критические точки', 'en': 'Critical Points'},
+    'Increasing Intervals': {'ru': 'Промежутки возрастания', 'en': 'Increasing Intervals'},
+    'Decreasing Intervals': {'ru': 'Промежутки убывания', 'en': 'Decreasing Intervals'},
+    'Extrema Values': {'ru': 'Значения экстремумов', 'en': 'Extrema Values'},
+    'Second Derivative Analysis': {'ru': 'Анализ второй производной', 'en': 'Second Derivative Analysis'},
+    'Inflection Points': {'ru': 'Точки перегиба', 'en': 'Inflection Points'},
+    'Concave Up Intervals': {'ru': 'Промежутки выпуклости вверх', 'en': 'Concave Up Intervals'},
+    'Concave Down Intervals': {'ru': 'Промежутки выпуклости вниз', 'en': 'Concave Down Intervals'},
+    'Inflection Values': {'ru': 'Значения в точках перегиба', 'en': 'Inflection Values'}
+}
+
+
+def translate(key, language):
+    """Label ``key`` in ``language`` ('ru' or 'en'); unknown keys are returned unchanged."""
+    return TRANSLATIONS.get(key, {}).get(language, key)
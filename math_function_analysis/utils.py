@@ -1,3 +1,9 @@
+import multiprocessing
+import os
+import threading
+import time
+
+
 def is_real_number(value):
     """Check if the value is a real number."""
     return value.is_real
@@ -7,4 +13,112 @@ def safe_divide(numerator, denominator):
     try:
         return numerator / denominator
     except ZeroDivisionError:
-        return float('inf') if numerator > 0 else float('-inf')
\ No newline at end of file
+        return float('inf') if numerator > 0 else float('-inf')
+
+def run_with_timeout(func, timeout, *args, **kwargs):
+    """Run func in a solver process and raise TimeoutError if it does not finish in time.
+
+    Solver processes are started on demand and reused for later calls; the
+    clock starts only once the process is ready, so its start-up time never
+    counts against ``timeout``. On timeout the process is killed, so the call
+    stops using CPU, and a fresh one is started next time. ``func``, its
+    arguments and its result must be picklable.
+    """
+    with _pool_lock:
+        solver = _idle_solvers.pop() if _idle_solvers else None
+    if solver is None:
+        solver = _SolverProcess(_solver_context())
+    try:
+        status, value = solver.call(func, timeout, args, kwargs)
+    except BaseException:
+        solver.stop()
+        raise
+    with _pool_lock:
+        _idle_solvers.append(solver)
+    if status == 'error':
+        raise value
+    return value
+
+
+class _SolverProcess:
+    """A child process that runs the functions it is sent, one at a time."""
+
+    def __init__(self, context):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.ready = False
+
+    def call(self, func, timeout, args, kwargs):
+        if not self.ready:
+            self._receive(func)
+            self.ready = True
+        self.connection.send((func, args, kwargs))
+        if not self.connection.poll(timeout):
+            raise TimeoutError(f"{getattr(func, '__name__', func)} did not finish within {timeout} seconds")
+        return self._receive(func)
+
+    def stop(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def _receive(self, func):
+        try:
+            return self.connection.recv()
+        except EOFError:
+            raise RuntimeError(f"{getattr(func, '__name__', func)} exited with code {self.process.exitcode}") from None
+
+
+_pool_lock = threading.Lock()
+_idle_solvers = []
+
+
+def _forget_solvers():
+    # Solver processes belong to the parent; a forked child starts its own.
+    global _pool_lock, _idle_solvers
+    _pool_lock = threading.Lock()
+    _idle_solvers = []
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_solvers)
+
+
+def _solver_context():
+    context = multiprocessing.get_context()
+    if context.get_start_method() == 'fork' and threading.active_count() > 1:
+        # Forking a process that runs other threads can deadlock the child.
+        return multiprocessing.get_context('forkserver')
+    return context
+
+
+def _serve(connection):
+    threading.Thread(target=_exit_with_parent, args=(os.getppid(),), daemon=True).start()
+    connection.send(('ready', None))
+    while True:
+        try:
+            func, args, kwargs = connection.recv()
+        except EOFError:
+            break
+        _run_and_send(connection, func, args, kwargs)
+
+
+def _exit_with_parent(parent):
+    # A solver left behind by a killed parent would otherwise run until its solve ends.
+    while os.getppid() == parent:
+        time.sleep(1)
+    os._exit(0)
+
+
+def _run_and_send(connection, func, args, kwargs):
+    try:
+        message = ('ok', func(*args, **kwargs))
+    except Exception as e:
+        message = ('error', e)
+    try:
+        connection.send(message)
+    except Exception as e:
+        # The result or the exception could not be pickled.
+        connection.send(('error', RuntimeError(f"{type(e).__name__}: {e}")))
@@ -6,6 +6,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         'sympy',
+        'numpy',
         'matplotlib',
         'ipython'
     ],
@@ -18,5 +19,5 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.9',
 )
\ No newline at end of file
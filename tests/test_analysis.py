@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 from math_function_analysis.analysis import MathFunctionAnalysis
 import sympy as sp
 
@@ -42,5 +43,58 @@ class TestMathFunctionAnalysis(unittest.TestCase):
         expected_inflection_values = {-sp.sqrt(2)/2: -sp.sqrt(2), sp.sqrt(2)/2: sp.sqrt(2)}
         self.assertEqual(self.analysis.second_derivative_analysis['inflection_values'], expected_inflection_values)
 
+class TestLazyStages(unittest.TestCase):
+    def test_stages_are_not_computed_on_init(self):
+        analysis = MathFunctionAnalysis("1 / (x**2 - 1)")
+        self.assertEqual(analysis._results, {})
+
+    def test_stage_is_computed_on_access_and_memoized(self):
+        analysis = MathFunctionAnalysis("1 / (x**2 - 1)")
+        domain = analysis.domain
+        self.assertEqual(set(analysis._results), {'domain'})
+        self.assertIs(analysis.domain, domain)
+
+    def test_dependencies_are_resolved(self):
+        analysis = MathFunctionAnalysis("x**3 - 3*x")
+        analysis.first_derivative_analysis
+        self.assertEqual(set(analysis._results), {'domain', 'first_derivative_analysis'})
+
+    def test_compute(self):
+        analysis = MathFunctionAnalysis("1 / (x**2 - 1)")
+        results = analysis.compute(stages=['asymptotes'])
+        self.assertEqual(list(results), ['asymptotes'])
+        self.assertEqual(results['asymptotes']['vertical'], [-1, 1])
+        self.assertEqual(set(analysis.compute()), set(MathFunctionAnalysis.STAGES))
+
+    def test_unknown_stage(self):
+        analysis = MathFunctionAnalysis("x")
+        with self.assertRaises(ValueError):
+            analysis.compute(stages=['range'])
+
+
+class TestSharedIntermediates(unittest.TestCase):
+    def test_each_expression_is_solved_once(self):
+        analysis = MathFunctionAnalysis("x * exp(-x)")
+        with mock.patch('math_function_analysis.analysis.sp.solve', wraps=sp.solve) as solve:
+            analysis.compute()
+        solved = [call.args[0] for call in solve.call_args_list]
+        self.assertEqual(len(solved), len(set(solved)))
+        self.assertEqual(len(solved), 4)
+
+    def test_intermediates_are_shared(self):
+        analysis = MathFunctionAnalysis("x**3 - 3*x")
+        derivative = analysis._intermediate('simplified_derivative', 1)
+        self.assertIs(analysis.first_derivative_analysis['derivative'], derivative)
+        self.assertEqual(analysis._intermediate('sorted_real_roots', 'simplified_derivative', 1), [sp.Float(-1), sp.Float(1)])
+
+    def test_second_derivative_matches_direct_computation(self):
+        x = sp.symbols('x')
+        for expression in ("(x**5 - 2)/(x**2 + x + 1)", "1/(x**5 - x - 1)"):
+            with self.subTest(expression=expression):
+                expected = sp.simplify(sp.diff(sp.sympify(expression), x, 2))
+                derivative = MathFunctionAnalysis(expression)._intermediate('simplified_derivative', 2)
+                self.assertEqual(derivative, expected)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,56 @@
+import multiprocessing
+import time
+import unittest
+from unittest import mock
+
+from math_function_analysis import MathFunctionAnalysis, analyze_many
+
+
+def _hang(self):
+    time.sleep(60)
+
+
+class TestAnalyzeMany(unittest.TestCase):
+    def test_results_for_every_expression(self):
+        expressions = ["1 / (x**2 - 1)", "x**2", "x**3 - 3*x"]
+        results = list(analyze_many(expressions, workers=2, stages=['domain', 'asymptotes']))
+        self.assertEqual(sorted(result.index for result in results), [0, 1, 2])
+        for result in results:
+            self.assertEqual(result.status, 'ok')
+            self.assertEqual(set(result.results), {'domain', 'asymptotes'})
+        by_index = {result.index: result for result in results}
+        self.assertEqual(by_index[0].results['asymptotes']['vertical'], [-1, 1])
+
+    def test_errors_are_reported(self):
+        results = list(analyze_many(["x +* 2"], workers=1))
+        self.assertEqual(results[0].status, 'error')
+        self.assertIsNotNone(results[0].error)
+
+    def test_worker_startup_is_not_charged_to_the_budget(self):
+        context = multiprocessing.get_context('spawn')
+        results = list(analyze_many(["x**2", "x**3", "x+1", "x-1"], workers=4, stage_timeout=0.5,
+                                    stages=['domain'], context=context))
+        self.assertEqual([result.status for result in results], ['ok'] * 4)
+
+    def test_solver_options_are_passed_to_workers(self):
+        results = list(analyze_many(["x**2 - 2"], workers=1, stages=['intercepts'], mode='numeric',
+                                    search_window=(0, 5)))
+        self.assertEqual(results[0].status, 'ok')
+        roots = results[0].results['intercepts']['x']
+        self.assertEqual(len(roots), 1)
+        self.assertAlmostEqual(float(roots[0]), 2 ** 0.5)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "requires fork")
+    def test_hung_stage_times_out_and_worker_is_replaced(self):
+        context = multiprocessing.get_context('fork')
+        with mock.patch.object(MathFunctionAnalysis, '_find_asymptotes', _hang):
+            results = list(analyze_many(["x**2", "1/x"], workers=1, stage_timeout=1,
+                                        stages=['domain', 'asymptotes'], context=context))
+        self.assertEqual([result.status for result in results], ['timeout', 'timeout'])
+        self.assertEqual(results[0].timed_out_stage, 'asymptotes')
+        self.assertIn('domain', results[0].results)
+        self.assertLess(max(result.elapsed for result in results), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import copy
+import unittest
+
+from benchmarks import run
+
+
+def _report(mode='symbolic', **classes):
+    return {'version': run.BASELINE_VERSION, 'settings': {'mode': mode}, 'classes': classes}
+
+
+def _metrics(total_time=0.5, peak_memory=1000, timeout_rate=0.0, errors=0):
+    return {'count': 4, 'timeouts': int(timeout_rate * 4), 'errors': errors, 'timeout_rate': timeout_rate,
+            'total_time': total_time, 'median_time': total_time / 4, 'stages': {}, 'peak_memory': peak_memory}
+
+
+def _result(name, status='ok', wall_time=None, peak_memory=None, stages=None):
+    return {'class': name, 'status': status, 'wall_time': wall_time, 'peak_memory': peak_memory,
+            'stages': stages or {}}
+
+
+class TestCompare(unittest.TestCase):
+    def setUp(self):
+        self.baseline = _report(rationals=_metrics(), trig=_metrics(total_time=0.0625))
+
+    def regressions(self, threshold=0.25, min_delta=0.05, **changes):
+        current = copy.deepcopy(self.baseline)
+        for name, metrics in changes.items():
+            current['classes'][name].update(metrics)
+        return run.compare(self.baseline, current, threshold, min_delta)
+
+    def test_unchanged(self):
+        self.assertEqual(self.regressions(), [])
+
+    def test_timeout_rate_increase(self):
+        regressions = self.regressions(rationals={'timeout_rate': 0.25, 'timeouts': 1})
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('timeout rate 0% -> 25%', regressions[0])
+        self.assertEqual(self.regressions(trig={'timeout_rate': 0.0}), [])
+
+    def test_errors_increase(self):
+        self.assertEqual(self.regressions(rationals={'errors': 1}), ["rationals: errors 0 -> 1"])
+
+    def test_threshold_edge(self):
+        self.assertEqual(self.regressions(rationals={'total_time': 0.625}), [])
+        regressions = self.regressions(rationals={'total_time': 0.63})
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("rationals: total time"))
+        self.assertEqual(self.regressions(threshold=0.5, rationals={'total_time': 0.7}), [])
+
+    def test_min_delta_edge(self):
+        # Quadrupling a tiny latency is noise as long as the change stays below min_delta.
+        self.assertEqual(self.regressions(min_delta=0.125, trig={'total_time': 0.1875}), [])
+        self.assertEqual(len(self.regressions(min_delta=0.125, trig={'total_time': 0.25})), 1)
+        self.assertEqual(self.regressions(trig={'total_time': 0.0}), [])
+
+    def test_peak_memory_growth(self):
+        self.assertEqual(self.regressions(rationals={'peak_memory': 1250}), [])
+        self.assertEqual(self.regressions(rationals={'peak_memory': 1251}),
+                         ["rationals: peak memory 1000 B -> 1251 B (+25%)"])
+        self.assertEqual(self.regressions(rationals={'peak_memory': None}), [])
+
+    def test_missing_class_is_skipped(self):
+        current = _report(rationals=_metrics())
+        self.assertEqual(run.compare(self.baseline, current), [])
+
+    def test_different_mode(self):
+        with self.assertRaises(ValueError):
+            run.compare(self.baseline, _report(mode='numeric', **self.baseline['classes']))
+
+    def test_unsupported_version(self):
+        baseline = dict(self.baseline, version=run.BASELINE_VERSION + 1)
+        with self.assertRaises(ValueError):
+            run.compare(baseline, self.baseline)
+
+
+class TestSummarize(unittest.TestCase):
+    def test_per_class_metrics(self):
+        results = [
+            _result('rationals', wall_time=0.5, peak_memory=100, stages={'domain': 0.25}),
+            _result('rationals', wall_time=1.5, peak_memory=300, stages={'domain': 0.5, 'intercepts': 1.0}),
+            _result('rationals', status='timeout'),
+            _result('rationals', status='error'),
+            _result('trig', status='timeout'),
+        ]
+        classes = run.summarize(results)
+        self.assertEqual(list(classes), ['rationals', 'trig'])
+        rationals = classes['rationals']
+        self.assertEqual((rationals['count'], rationals['timeouts'], rationals['errors']), (4, 1, 1))
+        self.assertEqual(rationals['timeout_rate'], 0.25)
+        self.assertEqual(rationals['total_time'], 2.0)
+        self.assertEqual(rationals['median_time'], 1.0)
+        self.assertEqual(rationals['stages'], {'domain': 0.75, 'intercepts': 1.0})
+        self.assertEqual(rationals['peak_memory'], 300)
+        trig = classes['trig']
+        self.assertEqual(trig['timeout_rate'], 1.0)
+        self.assertIsNone(trig['median_time'])
+        self.assertIsNone(trig['peak_memory'])
+
+
+if __name__ == '__main__':
+    unittest.main()
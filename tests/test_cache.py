@@ -0,0 +1,106 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import sympy as sp
+
+from math_function_analysis import AnalysisCache, MathFunctionAnalysis
+
+
+class TestAnalysisCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_key_is_canonical(self):
+        cache = AnalysisCache(self.path)
+        self.assertEqual(cache.key("1/(x**2 - 1)"), cache.key(sp.sympify("1 / (-1 + x**2)")))
+        self.assertNotEqual(cache.key("1/(x**2 - 1)"), cache.key("1/(x**2 + 1)"))
+
+    def test_key_depends_on_sympy_version(self):
+        cache = AnalysisCache(self.path)
+        key = cache.key("x**2")
+        with mock.patch.object(sp, '__version__', '0.0'):
+            self.assertNotEqual(cache.key("x**2"), key)
+
+    def test_get_and_set(self):
+        cache = AnalysisCache(self.path)
+        key = cache.key("x**2")
+        self.assertIsNone(cache.get(key, 'domain'))
+        cache.set(key, 'domain', sp.S.Reals)
+        self.assertEqual(cache.get(key, 'domain'), sp.S.Reals)
+
+    def test_analysis_uses_cache(self):
+        MathFunctionAnalysis("1 / (x**2 - 1)", cache=AnalysisCache(self.path)).compute()
+        analysis = MathFunctionAnalysis("1 / (x**2 - 1)", cache=AnalysisCache(self.path))
+        with mock.patch('math_function_analysis.analysis.sp.solve') as solve:
+            self.assertEqual(analysis.asymptotes['vertical'], [-1, 1])
+            analysis.compute()
+        solve.assert_not_called()
+
+    def test_auto_mode_key_depends_on_solve_timeout(self):
+        cache = AnalysisCache(self.path)
+        MathFunctionAnalysis("x**2 - 2", cache=cache, mode='auto', solve_timeout=0).compute(['intercepts'])
+        analysis = MathFunctionAnalysis("x**2 - 2", cache=cache, mode='auto', solve_timeout=30)
+        self.assertEqual(analysis.intercepts['x'], [-sp.sqrt(2), sp.sqrt(2)])
+
+    def test_max_entries_evicts_least_recently_used(self):
+        cache = AnalysisCache(self.path, max_entries=2, touch_interval=0)
+        cache.set('a', 'domain', 1)
+        cache.set('b', 'domain', 2)
+        cache.get('a', 'domain')
+        cache.set('c', 'domain', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b', 'domain'))
+        self.assertEqual(cache.get('a', 'domain'), 1)
+
+    def test_max_bytes(self):
+        cache = AnalysisCache(self.path, max_bytes=1000)
+        for i in range(10):
+            cache.set(str(i), 'domain', 'x' * 300)
+        self.assertLessEqual(cache.total_bytes(), 1000)
+        self.assertEqual(cache.get('9', 'domain'), 'x' * 300)
+
+    def test_hits_refresh_access_time_sparingly(self):
+        cache = AnalysisCache(self.path)
+        cache.set('a', 'domain', 1)
+        query = "SELECT accessed FROM entries WHERE key = 'a'"
+        accessed = cache._connect().execute(query).fetchone()[0]
+        cache.get('a', 'domain')
+        self.assertEqual(cache._connect().execute(query).fetchone()[0], accessed)
+        cache.touch_interval = 0
+        cache.get('a', 'domain')
+        self.assertGreater(cache._connect().execute(query).fetchone()[0], accessed)
+
+    def test_concurrent_threads_and_processes(self):
+        cache = AnalysisCache(self.path)
+        cache.set('shared', 'domain', 0)
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=_fill, args=(cache, f'process{i}')) for i in range(3)]
+        for process in processes:
+            process.start()
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(_fill, [cache] * 4, [f'thread{i}' for i in range(4)]))
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+        self.assertEqual(len(cache), 1 + 7 * 20)
+        self.assertEqual(cache.get('thread3', '19'), 19)
+        self.assertEqual(cache.get('process2', '19'), 19)
+
+
+def _fill(cache, key):
+    for i in range(20):
+        cache.set(key, str(i), i)
+        assert cache.get(key, str(i)) == i
+        assert cache.get('shared', 'domain') == 0
+
+
+if __name__ == '__main__':
+    unittest.main()
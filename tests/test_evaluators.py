@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from math_function_analysis import MathFunctionAnalysis
+
+
+class TestEvaluators(unittest.TestCase):
+    def setUp(self):
+        self.analysis = MathFunctionAnalysis("1 / (x**2 - 1)")
+
+    def test_evaluators_are_cached(self):
+        self.assertIs(self.analysis.evaluator(), self.analysis.evaluator())
+        self.assertIsNot(self.analysis.evaluator(1), self.analysis.evaluator(2))
+
+    def test_function_and_derivatives(self):
+        xs = np.array([0.0, 2.0])
+        np.testing.assert_allclose(self.analysis.evaluator()(xs), [-1, 1 / 3])
+        np.testing.assert_allclose(self.analysis.evaluator(1)(xs), [0, -4 / 9])
+        np.testing.assert_allclose(self.analysis.evaluator(2)(xs), [-2, 26 / 27])
+        self.assertEqual(self.analysis.evaluator()(0.0), -1)
+
+    def test_points_outside_domain_are_nan(self):
+        values = MathFunctionAnalysis("sqrt(x)").evaluator()(np.array([-4.0, 0.0, 4.0]))
+        np.testing.assert_array_equal(np.isnan(values), [True, False, False])
+        self.assertTrue(np.isnan(self.analysis.evaluator(1)(1.0)))
+
+
+class TestTabulate(unittest.TestCase):
+    def test_in_memory(self):
+        table = MathFunctionAnalysis("x**3").tabulate(-1, 1, 5, chunk=2)
+        self.assertEqual(table.shape, (5, 4))
+        np.testing.assert_allclose(table[:, 0], np.linspace(-1, 1, 5))
+        np.testing.assert_allclose(table[:, 1], table[:, 0] ** 3)
+        np.testing.assert_allclose(table[:, 2], 3 * table[:, 0] ** 2)
+        np.testing.assert_allclose(table[:, 3], 6 * table[:, 0])
+
+    def test_memmap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'table.dat')
+            table = MathFunctionAnalysis("1 / (x**2 - 1)").tabulate(-2, 2, 101, chunk=10, out=path, orders=(0,))
+            self.assertIsInstance(table, np.memmap)
+            stored = np.memmap(path, dtype=np.float64, mode='r', shape=(101, 2))
+            self.assertTrue(np.isnan(stored[25, 1]))
+            self.assertEqual(stored[50, 1], -1)
+            del table, stored
+
+
+if __name__ == '__main__':
+    unittest.main()
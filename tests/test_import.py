@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+import unittest
+
+# Seconds the package may add on top of importing NumPy and SymPy themselves.
+IMPORT_BUDGET = 0.5
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import numpy, sympy
+dependencies = time.perf_counter() - start
+start = time.perf_counter()
+import math_function_analysis
+package = time.perf_counter() - start
+print(json.dumps({'dependencies': dependencies, 'package': package,
+                  'modules': [name for name in ('matplotlib', 'IPython', 'asyncio') if name in sys.modules]}))
+"""
+
+
+class TestImport(unittest.TestCase):
+    def _import(self):
+        output = subprocess.run([sys.executable, '-c', SCRIPT], capture_output=True, text=True, check=True).stdout
+        return json.loads(output)
+
+    def test_rendering_stacks_are_not_imported(self):
+        self.assertEqual(self._import()['modules'], [])
+
+    def test_import_time_budget(self):
+        # The best of a few runs, so that a busy machine does not fail the test.
+        package = min(self._import()['package'] for _ in range(3))
+        self.assertLess(package, IMPORT_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import multiprocessing
+import os
+import time
+import unittest
+
+import sympy as sp
+
+from math_function_analysis import MathFunctionAnalysis
+from math_function_analysis.numeric import find_roots
+from math_function_analysis.utils import run_with_timeout
+
+x = sp.symbols('x')
+
+
+class TestFindRoots(unittest.TestCase):
+    def assertRootsAlmostEqual(self, roots, expected):
+        self.assertEqual(len(roots), len(expected))
+        for root, value in zip(roots, expected):
+            self.assertAlmostEqual(float(root), float(value), places=9)
+
+    def test_polynomial(self):
+        self.assertRootsAlmostEqual(find_roots(x**3 - 3*x, x), [-sp.sqrt(3), 0, sp.sqrt(3)])
+
+    def test_transcendental(self):
+        expression = sp.sin(x) * sp.exp(-x / 5) - sp.Rational(1, 10)
+        roots = find_roots(expression, x)
+        self.assertEqual(len(roots), 7)
+        for root in roots:
+            self.assertAlmostEqual(float(expression.subs(x, root)), 0, places=9)
+
+    def test_poles_are_not_roots(self):
+        self.assertEqual(find_roots(1 / x, x), [])
+        self.assertRootsAlmostEqual(find_roots(sp.tan(x), x, window=(-4, 4)), [-sp.pi, 0, sp.pi])
+
+    def test_domain_is_respected(self):
+        expression = sp.log(x) / x
+        domain = sp.calculus.util.continuous_domain(expression, x, sp.S.Reals)
+        self.assertRootsAlmostEqual(find_roots(expression, x, domain), [1])
+        self.assertRootsAlmostEqual(find_roots(x**2 - 4, x, sp.Interval(0, sp.oo)), [2])
+
+    def test_identically_zero(self):
+        self.assertEqual(find_roots(sp.S.Zero, x), [])
+        self.assertEqual(find_roots(sp.sin(x)**2 + sp.cos(x)**2 - 1, x), [])
+
+    def test_window(self):
+        self.assertEqual(find_roots(x - 100, x), [])
+        self.assertRootsAlmostEqual(find_roots(x - 100, x, window=(0, 1000)), [100])
+
+
+class TestSolveModes(unittest.TestCase):
+    def test_numeric_mode(self):
+        analysis = MathFunctionAnalysis("x**3 - 3*x", mode='numeric')
+        critical_points = analysis.first_derivative_analysis['critical_points']
+        self.assertEqual([float(point) for point in critical_points], [-1.0, 1.0])
+
+    def test_numeric_mode_linear_and_constant(self):
+        linear = MathFunctionAnalysis("2*x + 1", mode='numeric')
+        self.assertEqual([float(point) for point in linear.intercepts['x']], [-0.5])
+        self.assertEqual(linear.first_derivative_analysis['critical_points'], [])
+        self.assertEqual(linear.second_derivative_analysis['inflection_points'], [])
+        constant = MathFunctionAnalysis("5", mode='numeric')
+        self.assertEqual(constant.intercepts['x'], [])
+        self.assertEqual(constant.first_derivative_analysis['critical_points'], [])
+        self.assertEqual(constant.second_derivative_analysis['inflection_points'], [])
+
+    def test_no_roots_at_removable_singularity(self):
+        analysis = MathFunctionAnalysis("sin(x)/x", mode='numeric')
+        critical_points = [float(point) for point in analysis.first_derivative_analysis['critical_points']]
+        inflection_points = [float(point) for point in analysis.second_derivative_analysis['inflection_points']]
+        self.assertTrue(all(abs(point) > 1 for point in critical_points + inflection_points))
+        self.assertEqual(len(critical_points), 4)
+
+    def test_numeric_mode_search_window(self):
+        self.assertEqual(MathFunctionAnalysis("x - 100", mode='numeric').intercepts['x'], [])
+        analysis = MathFunctionAnalysis("x - 100", mode='numeric', search_window=(-1000, 1000))
+        self.assertEqual([float(point) for point in analysis.intercepts['x']], [100.0])
+
+    def test_auto_mode_uses_symbolic_results_when_available(self):
+        analysis = MathFunctionAnalysis("x**3 - 3*x", mode='auto')
+        self.assertEqual(analysis.first_derivative_analysis['critical_points'], [-1, 1])
+
+    def test_auto_mode_falls_back_after_time_budget(self):
+        analysis = MathFunctionAnalysis("sin(x)*exp(-x/5) - 0.1", mode='auto', solve_timeout=0)
+        start = time.monotonic()
+        intercepts = analysis.intercepts['x']
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(len(intercepts), 7)
+        self.assertTrue(all(isinstance(root, sp.Float) for root in intercepts))
+
+    def test_timed_out_solve_is_stopped(self):
+        run_with_timeout(int, 30)
+        children = len(multiprocessing.active_children())
+        with self.assertRaises(TimeoutError):
+            run_with_timeout(_spin, 0.2)
+        self.assertEqual(len(multiprocessing.active_children()), children - 1)
+        self.assertEqual(run_with_timeout(sp.solve, 30, x**2 - 4, x), [-2, 2])
+        with self.assertRaises(ZeroDivisionError):
+            run_with_timeout(divmod, 30, 1, 0)
+
+    def test_solver_process_is_reused(self):
+        pid = run_with_timeout(os.getpid, 30)
+        self.assertNotEqual(pid, os.getpid())
+        self.assertEqual(run_with_timeout(os.getpid, 30), pid)
+
+    def test_auto_mode_is_exact_when_solve_is_fast(self):
+        run_with_timeout(int, 30)
+        analysis = MathFunctionAnalysis("x*exp(-x)", mode='auto', solve_timeout=1)
+        self.assertEqual(analysis.intercepts['x'], [0])
+        self.assertEqual(analysis.first_derivative_analysis['critical_points'], [1])
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            MathFunctionAnalysis("x", mode='fast')
+
+
+def _spin():
+    while True:
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
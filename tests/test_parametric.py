@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+import sympy as sp
+
+from math_function_analysis import MathFunctionAnalysis, ParametricAnalysis
+
+
+class TestParametricAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.family = ParametricAnalysis("a*x/(x**2 + b)")
+
+    def test_parameters_are_detected(self):
+        self.assertEqual(self.family.parameters, sp.symbols('a b'))
+        a, b = self.family.parameters
+        self.assertEqual(set(self.family.critical_points), {-sp.sqrt(b), sp.sqrt(b)})
+
+    def test_matches_individual_analysis(self):
+        results = self.family.evaluate(a=[1, 3, -2], b=[1, 4, 9])
+        for row, (a, b) in enumerate([(1, 1), (3, 4), (-2, 9)]):
+            analysis = MathFunctionAnalysis(f"{a}*x/(x**2 + {b})")
+            first = analysis.first_derivative_analysis
+            expected = sorted(float(point) for point in first['critical_points'])
+            np.testing.assert_allclose(sorted(results['critical_points'][row]), expected)
+            expected_values = sorted(float(value) for value in first['extrema_values'].values())
+            np.testing.assert_allclose(sorted(results['extrema_values'][row]), expected_values)
+            self.assertEqual(results['y_intercept'][row], 0)
+            np.testing.assert_array_equal(results['horizontal_asymptotes'][row], [0, 0])
+        self.assertFalse(results['degenerate'].any())
+
+    def test_missing_points_are_nan(self):
+        results = self.family.evaluate(a=1, b=[-1, 1])
+        self.assertTrue(np.isnan(results['critical_points'][0]).all())
+        np.testing.assert_allclose(np.sort(results['vertical_asymptotes'][0]), [-1, 1])
+        self.assertTrue(np.isnan(results['vertical_asymptotes'][1]).all())
+
+    def test_x_intercepts_outside_domain_are_nan(self):
+        results = self.family.evaluate(a=1, b=[0, 1])
+        # With b = 0 the function is 1/x: x = 0 solves the numerator but is a pole.
+        self.assertEqual(MathFunctionAnalysis("1/x").intercepts['x'], [])
+        self.assertTrue(np.isnan(results['x_intercepts'][0]).all())
+        np.testing.assert_array_equal(results['x_intercepts'][1], [0])
+        self.assertFalse(results['degenerate'].any())
+
+    def test_grids_are_broadcast(self):
+        results = self.family.evaluate(a=np.array([1., 2.])[:, None], b=np.array([1., 4., 9.])[None, :])
+        np.testing.assert_array_equal(results['a'], [1, 1, 1, 2, 2, 2])
+        np.testing.assert_array_equal(results['b'], [1, 4, 9, 1, 4, 9])
+        np.testing.assert_allclose(np.sort(results['critical_points'][4]), [-2, 2])
+
+    def test_unknown_limits_do_not_make_rows_degenerate(self):
+        results = ParametricAnalysis("exp(a*x) - b").evaluate(a=[1, 2], b=[1, 4])
+        self.assertFalse(results['degenerate'].any())
+        self.assertTrue(np.isnan(results['horizontal_asymptotes']).all())
+        np.testing.assert_allclose(results['x_intercepts'][:, 0], [0, np.log(2)])
+
+    def test_degenerate_rows_fall_back(self):
+        results = self.family.evaluate(a=[0, 1], b=1)
+        np.testing.assert_array_equal(results['degenerate'], [True, False])
+        self.assertTrue(np.isnan(results['critical_points'][0]).all())
+        np.testing.assert_array_equal(results['horizontal_asymptotes'][0], [0, 0])
+
+    def test_oblique_asymptote(self):
+        results = ParametricAnalysis("(a*x**2 + 1)/(x - b)").evaluate(a=[1, 2], b=[0, 1])
+        np.testing.assert_allclose(results['oblique_slope'], [1, 2])
+        np.testing.assert_allclose(results['oblique_intercept'], [0, 2])
+        np.testing.assert_array_equal(results['horizontal_asymptotes'], [[np.inf, -np.inf], [np.inf, -np.inf]])
+
+    def test_missing_parameter(self):
+        with self.assertRaises(ValueError):
+            self.family.evaluate(a=[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from math_function_analysis import MathFunctionAnalysis
+from math_function_analysis import plotting
+
+
+class TestPlotting(unittest.TestCase):
+    def setUp(self):
+        self.analysis = MathFunctionAnalysis("1 / (x**2 - 1)", language='en')
+
+    def test_auto_range_covers_features(self):
+        start, end = plotting.auto_range(self.analysis)
+        self.assertLess(start, -1)
+        self.assertGreater(end, 1)
+
+    def test_auto_range_is_clipped_to_domain(self):
+        start, end = plotting.auto_range(MathFunctionAnalysis("sqrt(x)"))
+        self.assertEqual(start, 0)
+        self.assertGreater(end, 0)
+
+    def test_sampling_is_denser_near_poles(self):
+        xs = plotting.sample(self.analysis, (-5, 5), points=400)
+        self.assertTrue(np.all(np.diff(xs) > 0))
+        self.assertIn(1.0, xs)
+        self.assertGreater(np.sum(np.abs(xs - 1) < 0.1), np.sum(np.abs(xs - 3) < 0.1))
+
+    def test_evaluate_masks_poles(self):
+        ys = plotting.evaluate(self.analysis, np.array([-1.0, 0.0, 1.0, 2.0]))
+        np.testing.assert_array_equal(np.isnan(ys), [True, False, True, False])
+        self.assertEqual(ys[1], -1)
+
+    def test_evaluate_masks_values_outside_domain(self):
+        ys = plotting.evaluate(MathFunctionAnalysis("sqrt(x)"), np.array([-1.0, 4.0]))
+        self.assertTrue(np.isnan(ys[0]))
+        self.assertEqual(ys[1], 2)
+
+    def test_render_png_and_svg(self):
+        self.assertTrue(self.analysis.render_plot().startswith(b'\x89PNG'))
+        self.assertIn(b'<svg', self.analysis.render_plot(format='svg'))
+
+    def test_render_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'plot.png')
+            self.assertIsNone(self.analysis.render_plot(path, x_range=(-3, 3)))
+            self.assertGreater(os.path.getsize(path), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import tracemalloc
+import unittest
+from unittest import mock
+
+from math_function_analysis import AnalysisStats, MathFunctionAnalysis
+
+
+class TestProfiling(unittest.TestCase):
+    def test_disabled_by_default(self):
+        analysis = MathFunctionAnalysis("x**2 - 1")
+        analysis.compute()
+        self.assertIsNone(analysis.stats)
+
+    def test_stages_are_recorded(self):
+        analysis = MathFunctionAnalysis("exp(x) / x", profile=True)
+        analysis.compute()
+        stages = analysis.stats.stages
+        for name in MathFunctionAnalysis.STAGES + ('vertical_asymptotes', 'horizontal_asymptotes',
+                                                   'oblique_asymptotes'):
+            self.assertEqual(stages[name].calls, 1, name)
+            self.assertGreaterEqual(stages[name].wall_time, 0)
+        # Intermediates are recorded too: the function, the denominator and both derivatives are solved.
+        self.assertEqual(stages['roots'].calls, 4)
+        self.assertEqual(stages['simplified_derivative'].calls, 2)
+        self.assertEqual(stages['interval_classification'].calls, 4)
+        self.assertIsNone(stages['domain'].peak_memory)
+        # Stage times include the intermediates they computed.
+        self.assertGreaterEqual(stages['first_derivative_analysis'].wall_time,
+                                stages['interval_classification'].wall_time / 4)
+
+    def test_rendering(self):
+        analysis = MathFunctionAnalysis("x**3", profile=True)
+        with mock.patch('math_function_analysis.notebook.display'):
+            analysis.display_report()
+            analysis.step_by_step_analysis()
+        self.assertEqual(analysis.stats.stages['rendering'].calls, 2)
+
+    def test_hooks_and_memory(self):
+        events = []
+        stats = AnalysisStats(hooks=[lambda *event: events.append(event)], memory=True)
+        analysis = MathFunctionAnalysis("1 / (x**2 - 4)", profile=stats)
+        analysis.compute('asymptotes')
+        self.assertEqual([event[0] for event in events if event[0].endswith('asymptotes')],
+                         ['vertical_asymptotes', 'horizontal_asymptotes', 'oblique_asymptotes', 'asymptotes'])
+        for name, wall_time, peak_memory in events:
+            self.assertGreaterEqual(peak_memory, 0)
+        self.assertGreaterEqual(stats.stages['asymptotes'].peak_memory, stats.stages['vertical_asymptotes'].peak_memory)
+        self.assertIn('asymptotes', stats.as_dict())
+        self.assertIn('asymptotes', str(stats))
+
+    def test_tracemalloc_is_stopped(self):
+        stats = AnalysisStats(memory=True)
+        MathFunctionAnalysis("x**2 - 1", profile=stats).compute('intercepts')
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(stats.stages['intercepts'].peak_memory, 0)
+        tracemalloc.start()
+        try:
+            MathFunctionAnalysis("x**3", profile=stats).compute('intercepts')
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+    def test_stats_can_be_shared(self):
+        stats = AnalysisStats()
+        for expression in ("x**2", "x**3"):
+            MathFunctionAnalysis(expression, profile=stats).compute('domain')
+        self.assertEqual(stats.stages['domain'].calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
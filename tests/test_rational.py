@@ -0,0 +1,88 @@
+import unittest
+from unittest import mock
+
+import sympy as sp
+
+from math_function_analysis import MathFunctionAnalysis
+from math_function_analysis import rational
+
+x = sp.symbols('x')
+
+EXPRESSIONS = [
+    "1 / (x**2 - 1)",
+    "x**3 - 3*x",
+    "(x**2 + 1)/(x - 2)",
+    "x/(x**2 + 1)",
+    "(x**2 - 1)/(x - 1)",
+    "(2*x**2 - 3)/(x**2 + x - 6)",
+    "(x - 3)/(x**2 - 4)",
+    "1/x",
+    "5",
+    "0",
+]
+
+
+class TestRationalFastPath(unittest.TestCase):
+    def test_matches_general_analysis(self):
+        for expression in EXPRESSIONS:
+            with self.subTest(expression=expression):
+                fast = MathFunctionAnalysis(expression).compute()
+                with mock.patch('math_function_analysis.rational.as_rational', return_value=None):
+                    general = MathFunctionAnalysis(expression).compute()
+                self.assertEqual(fast, general)
+
+    def test_general_solvers_are_not_used(self):
+        analysis = MathFunctionAnalysis("(x**2 + 1)/(x - 2)")
+        with mock.patch('math_function_analysis.analysis.sp.solve') as solve, \
+                mock.patch('math_function_analysis.analysis.sp.limit') as limit:
+            analysis.compute()
+        solve.assert_not_called()
+        limit.assert_not_called()
+
+    def test_high_degree_roots_are_isolated(self):
+        analysis = MathFunctionAnalysis("(x**4 - 1)/(x**3 - 4*x)")
+        with mock.patch('math_function_analysis.rational.sp.roots', wraps=sp.roots) as roots:
+            inflection_points = analysis.second_derivative_analysis['inflection_points']
+        self.assertTrue(all(call.args[0].degree() <= rational.RADICAL_MAX_DEGREE for call in roots.call_args_list))
+        self.assertEqual(len(inflection_points), 6)
+        self.assertTrue(all(isinstance(point, sp.CRootOf) for point in inflection_points))
+        self.assertEqual(len(analysis._intermediate('sorted_real_roots', 'simplified_derivative', 2)), 2)
+
+    def test_undecidable_radicals_still_split_intervals(self):
+        # The critical points are real roots of an irreducible quartic with casus irreducibilis radicals.
+        analysis = MathFunctionAnalysis("(x**3 - 2*x + 1)/(x**2 - 4)")
+        real_roots = analysis._intermediate('sorted_real_roots', 'simplified_derivative', 1)
+        self.assertEqual(len(real_roots), 4)
+        self.assertEqual(len(analysis.first_derivative_analysis['decreasing_intervals']), 4)
+
+    def test_as_rational(self):
+        numerator, denominator = rational.as_rational(sp.sympify("(x**2 + 1)/(x - 2)"), x)
+        self.assertEqual(numerator, sp.Poly(x**2 + 1, x))
+        self.assertEqual(denominator, sp.Poly(x - 2, x))
+        self.assertIsNone(rational.as_rational(sp.exp(x) / x, x))
+        self.assertIsNone(rational.as_rational(sp.sympify("a*x/(x + 1)"), x))
+        self.assertIsNone(rational.as_rational(sp.sqrt(2) * x, x))
+
+    def test_limits_at_infinity(self):
+        def limits(expression):
+            return rational.limits_at_infinity(*rational.as_rational(sp.sympify(expression), x))
+
+        self.assertEqual(limits("(2*x + 1)/(3*x)"), (sp.Rational(2, 3), sp.Rational(2, 3)))
+        self.assertEqual(limits("-x**3/(x - 1)"), (-sp.oo, -sp.oo))
+        self.assertEqual(limits("x**3/(x - 1)**2"), (sp.oo, -sp.oo))
+
+    def test_real_roots(self):
+        self.assertEqual(rational.real_roots(sp.Poly((x**2 - 2) * (x**2 + 1), x)), [-sp.sqrt(2), sp.sqrt(2)])
+        self.assertEqual(rational.real_roots(sp.Poly(x**5 - x - 1, x)), [sp.CRootOf(x**5 - x - 1, 0)])
+        self.assertEqual(rational.sorted_real_roots(sp.Poly(x**2 - 1, x), sp.Poly(x - 1, x)), [sp.Float(-1)])
+
+    def test_sign(self):
+        numerator, denominator = rational.as_rational(sp.sympify("(x - 1)/(x + 2)"), x)
+        self.assertEqual(rational.sign(numerator, denominator, 0), -1)
+        self.assertEqual(rational.sign(numerator, denominator, 3), 1)
+        self.assertEqual(rational.sign(numerator, denominator, 1), 0)
+        self.assertIsNone(rational.sign(numerator, denominator, -2))
+
+
+if __name__ == '__main__':
+    unittest.main()
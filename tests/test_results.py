@@ -0,0 +1,61 @@
+import unittest
+from unittest import mock
+
+import sympy as sp
+
+from math_function_analysis import AnalysisResult, MathFunctionAnalysis
+from math_function_analysis.results import decode
+
+
+class TestAnalysisResult(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.analysis = MathFunctionAnalysis("(x**2 + 1) / (x - 2)")
+        cls.result = cls.analysis.serialize()
+
+    def test_values(self):
+        intercepts = self.result.stages['intercepts']['data']
+        self.assertEqual(intercepts['y'], {'s': 'Rational(-1, 2)', 'f': -0.5, 'l': '- \\frac{1}{2}'})
+        self.assertEqual(decode(intercepts['y']), sp.Rational(-1, 2))
+        self.assertEqual([decode(point) for point in intercepts['x']], [-sp.I, sp.I])
+        self.assertEqual([point['f'] for point in intercepts['x']], [None, None])
+        intervals = self.result.stages['first_derivative_analysis']['data']['decreasing_intervals']
+        self.assertAlmostEqual(intervals[1]['f'][1], 2 + 5 ** 0.5)
+        self.assertEqual([limit['f'] for limit in self.result.stages['asymptotes']['data']['horizontal']], [None, None])
+        self.assertEqual(decode(self.result.stages['domain']['data']), self.analysis.domain)
+
+    def test_round_trip(self):
+        self.assertEqual(AnalysisResult.from_json(self.result.to_json()), self.result)
+        data = self.result.to_bytes()
+        self.assertTrue(data.startswith(b'MFAR'))
+        self.assertLess(len(data), len(self.result.to_json().encode()))
+        self.assertEqual(AnalysisResult.from_bytes(data), self.result)
+
+    def test_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            AnalysisResult.from_bytes(b'PK\x03\x04')
+        with self.assertRaises(ValueError):
+            AnalysisResult.from_dict(dict(self.result.to_dict(), version=99))
+
+    def test_reports_without_sympy(self):
+        loaded = AnalysisResult.from_bytes(self.result.to_bytes())
+        with mock.patch('sympy.latex') as latex, mock.patch('sympy.srepr') as srepr:
+            for language in ('ru', 'en'):
+                analysis = MathFunctionAnalysis("(x**2 + 1) / (x - 2)", language=language)
+                self.assertEqual(loaded.report(language), analysis.report())
+                loaded.latex_report(language)
+                steps = loaded.latex_steps(language)
+        latex.assert_not_called()
+        srepr.assert_not_called()
+        self.assertEqual(steps[0], "\\textbf{Domain}: \\left(-\\infty, 2\\right) \\cup \\left(2, \\infty\\right)")
+
+    def test_partial(self):
+        result = self.analysis.serialize('domain')
+        self.assertEqual(list(result.stages), ['domain'])
+        self.assertIs(self.analysis.serialize('domain'), result)
+        with self.assertRaises(KeyError):
+            result.report()
+
+
+if __name__ == '__main__':
+    unittest.main()
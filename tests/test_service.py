@@ -0,0 +1,185 @@
+import asyncio
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import sympy as sp
+
+from math_function_analysis import AnalysisService, MathFunctionAnalysis, ServiceBusy, analyze_async
+from math_function_analysis import service as service_module
+from math_function_analysis.results import AnalysisResult
+from math_function_analysis.server import start_server
+
+
+class _BlockingAnalyze:
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+
+    def __call__(self, expression, stages, mode, cache, serialized=False):
+        self.calls.append(expression)
+        self.release.wait(10)
+        return {stage: str(expression) for stage in stages}
+
+
+class TestAnalysisService(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(2)
+        self.addCleanup(self.executor.shutdown)
+        self.blocking = _BlockingAnalyze()
+        patcher = mock.patch.object(service_module, '_analyze', self.blocking)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.blocking.release.set)
+
+    def test_identical_requests_are_coalesced(self):
+        async def scenario():
+            service = AnalysisService(executor=self.executor)
+            requests = [asyncio.ensure_future(service.analyze(expression, 'domain'))
+                        for expression in ("x + 1", "1+x", "x + 1")]
+            await _parsed(service)
+            self.assertEqual(service.pending, 1)
+            self.blocking.release.set()
+            return await asyncio.gather(*requests), service.pending
+
+        results, pending = asyncio.run(scenario())
+        self.assertEqual(len(self.blocking.calls), 1)
+        self.assertEqual(results, [{'domain': 'x + 1'}] * 3)
+        self.assertEqual(pending, 0)
+
+    def test_backpressure(self):
+        async def scenario():
+            service = AnalysisService(max_pending=1, executor=self.executor)
+            first = asyncio.ensure_future(service.analyze("x"))
+            await asyncio.sleep(0)
+            with self.assertRaises(ServiceBusy):
+                await service.analyze("x**2")
+            # Joining the computation in flight does not need a new slot.
+            second = asyncio.ensure_future(service.analyze("x"))
+            self.blocking.release.set()
+            await asyncio.gather(first, second)
+
+        asyncio.run(scenario())
+
+    def test_cancellation(self):
+        async def scenario():
+            service = AnalysisService(executor=self.executor)
+            first = asyncio.ensure_future(service.analyze("x"))
+            second = asyncio.ensure_future(service.analyze("x"))
+            await _parsed(service)
+            first.cancel()
+            await asyncio.sleep(0)
+            # The other request keeps the computation alive.
+            self.assertEqual(service.pending, 1)
+            second.cancel()
+            await asyncio.gather(first, second, return_exceptions=True)
+            await asyncio.sleep(0)
+            return service.pending
+
+        self.assertEqual(asyncio.run(scenario()), 0)
+
+    def test_expression_length_is_bounded(self):
+        service = AnalysisService(executor=self.executor, max_expression_length=10)
+        with self.assertRaises(ValueError):
+            asyncio.run(service.analyze("x + " * 10 + "x"))
+        self.assertEqual(self.blocking.calls, [])
+
+    def test_parsing_runs_off_the_loop(self):
+        parsed = threading.Event()
+
+        def slow_canonicalize(function_str):
+            parsed.wait(10)
+            return canonicalize(function_str)
+
+        async def scenario():
+            service = AnalysisService(executor=self.executor)
+            request = asyncio.ensure_future(service.analyze("9**9**9"))
+            # The loop keeps serving while the expression is being parsed.
+            await asyncio.sleep(0.05)
+            self.assertEqual((service.pending, self.blocking.calls), (1, []))
+            parsed.set()
+            await _parsed(service)
+            self.blocking.release.set()
+            return await request
+
+        canonicalize = service_module._canonicalize
+        with mock.patch.object(service_module, '_canonicalize', slow_canonicalize), \
+                mock.patch.object(service_module.sp, 'sympify', lambda function_str: sp.Symbol('x')):
+            self.assertEqual(asyncio.run(scenario()), {stage: 'x' for stage in MathFunctionAnalysis.STAGES})
+
+    def test_invalid_stage(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(AnalysisService(executor=self.executor).analyze("x", ['range']))
+
+
+async def _parsed(service, timeout=10):
+    """Wait until no request to ``service`` is still parsing its expression."""
+    # Let requests that were just scheduled start parsing first.
+    await asyncio.sleep(0)
+    deadline = asyncio.get_running_loop().time() + timeout
+    while service._parsing and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+
+
+class TestDefaultService(unittest.TestCase):
+    def test_analyze_async(self):
+        async def scenario():
+            try:
+                return await analyze_async("1 / (x**2 - 1)", stages=['domain', 'intercepts'])
+            finally:
+                service_module._default_service.close()
+                service_module._default_service = None
+
+        results = asyncio.run(scenario())
+        self.assertEqual(set(results), {'domain', 'intercepts'})
+        self.assertEqual(results['intercepts']['x'], [])
+
+
+class TestServer(unittest.TestCase):
+    def _request(self, raw):
+        async def scenario():
+            with ThreadPoolExecutor(1) as executor:
+                server = await start_server(AnalysisService(executor=executor), port=0)
+                port = server.sockets[0].getsockname()[1]
+                async with server:
+                    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                    writer.write(raw)
+                    response = await reader.read()
+                    writer.close()
+            head, _, body = response.partition(b'\r\n\r\n')
+            return int(head.split()[1]), body if b'octet-stream' in head else json.loads(body)
+
+        return asyncio.run(scenario())
+
+    def test_get(self):
+        status, payload = self._request(b"GET /analyze?expression=x**2-1&stages=intercepts HTTP/1.1\r\n\r\n")
+        self.assertEqual(status, 200)
+        self.assertEqual(payload['stages']['intercepts']['text'], "{'x': [-1, 1], 'y': -1}")
+        self.assertEqual([point['f'] for point in payload['stages']['intercepts']['data']['x']], [-1.0, 1.0])
+
+    def test_post(self):
+        body = json.dumps({'expression': '1/x', 'stages': ['asymptotes']}).encode()
+        status, payload = self._request(b"POST /analyze HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+        self.assertEqual(status, 200)
+        self.assertEqual(AnalysisResult.from_dict(payload).stages['asymptotes']['data']['vertical'][0]['l'], '0')
+
+    def test_binary_and_report(self):
+        status, payload = self._request(b"GET /analyze?expression=1/x&format=binary HTTP/1.1\r\n\r\n")
+        self.assertEqual(status, 200)
+        self.assertIn('Domain', AnalysisResult.from_bytes(payload).report('en'))
+        status, payload = self._request(b"GET /analyze?expression=1/x&language=en HTTP/1.1\r\n\r\n")
+        self.assertTrue(payload['report'].startswith('Domain: '))
+        self.assertEqual(len(payload['steps']), 15)
+
+    def test_errors(self):
+        self.assertEqual(self._request(b"GET /analyze HTTP/1.1\r\n\r\n")[0], 400)
+        self.assertEqual(self._request(b"GET /analyze?expression=x&stages=range HTTP/1.1\r\n\r\n")[0], 400)
+        self.assertEqual(self._request(b"GET /other HTTP/1.1\r\n\r\n")[0], 404)
+        self.assertEqual(self._request(b"GET /analyze?expression=x&format=xml HTTP/1.1\r\n\r\n")[0], 400)
+
+
+if __name__ == '__main__':
+    unittest.main()